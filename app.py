@@ -1,7 +1,7 @@
 import streamlit as st
 import asyncio
 import time
-from backend import TravelPlannerBackend
+from backend import TravelPlannerBackend, run_async
 
 # Configure Streamlit page
 st.set_page_config(
@@ -45,17 +45,17 @@ def add_message(role, content):
     """Add a message to the chat"""
     st.session_state.messages.append({"role": role, "content": content})
 
-def display_collected_info():
-    """Display collected information in sidebar"""
+def display_sidebar_status():
+    """Collected info, missing fields and progress, drawn in one place"""
     st.sidebar.header("📋 Collected Information")
-    
+
     if st.session_state.backend.collected_info:
         for key, value in st.session_state.backend.collected_info.items():
             readable_key = key.replace("_", " ").title()
             st.sidebar.text(f"{readable_key}: {value}")
     else:
         st.sidebar.text("No information collected yet")
-    
+
     # Show missing fields
     missing = st.session_state.backend.get_missing_fields()
     if missing:
@@ -64,6 +64,18 @@ def display_collected_info():
             readable_field = field.replace("_", " ").title()
             st.sidebar.text(f"• {readable_field}")
 
+    # Progress indicator
+    st.sidebar.markdown("---")
+    st.sidebar.header("📊 Progress")
+    if st.session_state.current_stage == "collecting_info":
+        st.sidebar.progress(25, "Collecting information...")
+    elif st.session_state.current_stage == "searching_flights_hotels":
+        st.sidebar.progress(50, "Searching flights & hotels...")
+    elif st.session_state.current_stage == "creating_itinerary":
+        st.sidebar.progress(75, "Creating itinerary...")
+    elif st.session_state.current_stage == "completed":
+        st.sidebar.progress(100, "Completed!")
+
 def process_user_input(user_input):
     """Process user input and update the conversation"""
     # Add user message to chat
@@ -85,17 +97,26 @@ def process_user_input(user_input):
 
 def search_flights_and_hotels():
     """Search for flights and hotels"""
-    with st.spinner("Searching for flights..."):
-        flights_info = st.session_state.backend.get_flights_info()
+    # Resolve the backend on the script thread: the background loop has no
+    # ScriptRunContext, so touching st.session_state there sees an empty state
+    backend = st.session_state.backend
+
+    async def _search_both(flights_coro, hotels_coro):
+        # Flight and hotel searches are independent, so run them concurrently
+        return await asyncio.gather(flights_coro, hotels_coro)
+
+    with st.spinner("Searching for flights and hotels..."):
+        flights_info, hotels_info = run_async(
+            _search_both(backend.get_flights_info_async(), backend.get_hotels_info_async())
+        )
+
         if "error" in flights_info:
             add_message("assistant", f"⚠️ Flight search error: {flights_info['error']}")
             st.session_state.flights_info = None
         else:
             st.session_state.flights_info = flights_info
             add_message("assistant", "✅ Found flight options!")
-    
-    with st.spinner("Searching for hotels..."):
-        hotels_info = st.session_state.backend.get_hotels_info()
+
         if isinstance(hotels_info, dict) and "error" in hotels_info:
             add_message("assistant", f"⚠️ Hotel search error: {hotels_info['error']}")
             st.session_state.hotels_info = None
@@ -103,21 +124,28 @@ def search_flights_and_hotels():
             st.session_state.hotels_info = hotels_info
             add_message("assistant", "✅ Found hotel options!")
     
-    # Find best options
+    # Find best options in a single LLM call
     best_flights = None
     best_hotels = None
-    
-    if st.session_state.flights_info and "error" not in st.session_state.flights_info:
-        with st.spinner("Finding best flights..."):
-            best_flights = st.session_state.backend.find_best_flight(st.session_state.flights_info)
-            if "error" not in str(best_flights):
-                add_message("assistant", "✅ Selected best flights based on your preferences!")
-    
-    if st.session_state.hotels_info and "error" not in str(st.session_state.hotels_info):
-        with st.spinner("Finding best hotels..."):
-            best_hotels = st.session_state.backend.get_best_hotels(st.session_state.hotels_info)
-            if "error" not in str(best_hotels):
-                add_message("assistant", "✅ Selected best hotels based on your preferences!")
+
+    flights_ok = st.session_state.flights_info and "error" not in st.session_state.flights_info
+    hotels_ok = st.session_state.hotels_info and "error" not in str(st.session_state.hotels_info)
+
+    if flights_ok or hotels_ok:
+        with st.spinner("Finding best flights and hotels..."):
+            best_options = st.session_state.backend.find_best_flight_and_hotel(
+                st.session_state.flights_info if flights_ok else None,
+                st.session_state.hotels_info if hotels_ok else None
+            )
+            if "error" not in best_options:
+                if flights_ok:
+                    best_flights = {
+                        "ongoing_flight": best_options.get("ongoing_flight"),
+                        "return_flight": best_options.get("return_flight")
+                    }
+                if hotels_ok:
+                    best_hotels = {"hotel": best_options.get("hotel")}
+                add_message("assistant", "✅ Selected best flights and hotels based on your preferences!")
     
     add_message("assistant", "Now let me create your personalized itinerary...")
     st.session_state.current_stage = "creating_itinerary"
@@ -125,16 +153,16 @@ def search_flights_and_hotels():
     st.session_state.best_hotels = best_hotels
 
 def create_itinerary():
-    """Create the final itinerary"""
-    with st.spinner("Creating your personalized itinerary... This may take a few minutes."):
-        itinerary = st.session_state.backend.create_itinerary(
+    """Create the final itinerary, streaming it into the chat as it is generated"""
+    with st.chat_message("assistant"):
+        itinerary = st.write_stream(st.session_state.backend.create_itinerary_stream(
             flights_info=getattr(st.session_state, 'best_flights', None),
             hotels_info=getattr(st.session_state, 'best_hotels', None)
-        )
-        
-        add_message("assistant", f"🎉 **Your Personalized Travel Itinerary is Ready!**\n\n{itinerary}")
-        st.session_state.itinerary_ready = True
-        st.session_state.current_stage = "completed"
+        ))
+
+    add_message("assistant", f"🎉 **Your Personalized Travel Itinerary is Ready!**\n\n{itinerary}")
+    st.session_state.itinerary_ready = True
+    st.session_state.current_stage = "completed"
 
 def main():
     """Main Streamlit app"""
@@ -153,19 +181,7 @@ def main():
             st.rerun()
         
         st.markdown("---")
-        display_collected_info()
-        
-        # Progress indicator
-        st.markdown("---")
-        st.header("📊 Progress")
-        if st.session_state.current_stage == "collecting_info":
-            st.progress(25, "Collecting information...")
-        elif st.session_state.current_stage == "searching_flights_hotels":
-            st.progress(50, "Searching flights & hotels...")
-        elif st.session_state.current_stage == "creating_itinerary":
-            st.progress(75, "Creating itinerary...")
-        elif st.session_state.current_stage == "completed":
-            st.progress(100, "Completed!")
+        display_sidebar_status()
     
     # Main chat interface
     st.header("💬 Chat with Trippy")
@@ -190,17 +206,23 @@ def main():
         You can provide all this information at once, or we can go step by step. Just start by telling me about your trip!
         """
         add_message("assistant", welcome_msg)
-        st.rerun()
+        # The history above was already rendered (empty), so just paint the
+        # welcome message inline instead of forcing a second cold rerun
+        with st.chat_message("assistant"):
+            st.markdown(welcome_msg)
     
-    # Handle different stages
+    # Handle different stages; each stage mutates state and falls through to the
+    # next one instead of forcing a full script rerun in between
     if st.session_state.current_stage == "searching_flights_hotels":
+        rendered_count = len(st.session_state.messages)
         search_flights_and_hotels()
-        st.rerun()
-    
-    elif st.session_state.current_stage == "creating_itinerary":
-        # Run synchronous function
+        # Render the status messages produced during the search inline
+        for message in st.session_state.messages[rendered_count:]:
+            with st.chat_message(message["role"]):
+                st.markdown(message["content"])
+
+    if st.session_state.current_stage == "creating_itinerary":
         create_itinerary()
-        st.rerun()
     
     # Chat input
     if st.session_state.current_stage in ["collecting_info"] or (st.session_state.current_stage == "completed" and st.session_state.itinerary_ready):
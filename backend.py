@@ -1,358 +1,569 @@
-import os
-import json
-import asyncio
-from llm import LLM
-from dotenv import load_dotenv
-
-from utils import get_data_from_url
-from hotel_search import search_hotels
-from google_search import GoogleSearch
-from flight_search import search_flights, display_flights
-from weather import get_travel_destination
-
-load_dotenv()
-
-class TravelPlannerBackend:
-    def __init__(self):
-        self.llm = LLM(os.getenv("api_base"), os.getenv("deployment_name"), os.getenv("api_version"))
-        self.required_fields = ["source", "destination", "start_date", "end_date", "number_of_adults", "budget_per_person", "number_of_children", "travel_style"]
-        self.collected_info = {}
-        self.conversation_history = []
-
-    def extract_info_from_input(self, user_input):
-        """Extract travel information from user input using LLM"""
-        prompt = f"""
-        You are a data extraction agent. Your task is to extract the following fields from user input: {', '.join(self.required_fields)}.
-
-        User Input: {user_input}
-
-        Response Format:
-        ```
-        {{
-            "source": "value",
-            "destination": "value",
-            "start_date": "value",
-            "end_date": "value",
-            "number_of_adults": "value",
-            "budget_per_person": "value",
-            "number_of_children": "value",
-            "travel_style": "value"
-        }}  
-        ```
-
-        If a field is not mentioned in the user input, do not include it in your response.
-        
-        Any response other than this format will be rejected by the system.
-        """
-        
-        # Use the conversation history for context
-        conversation = self.conversation_history + [{"role": "user", "content": prompt}]
-        info_response = self.llm.inference(conversation)
-        
-        # Extract JSON from response
-        try:
-            info_start = info_response.find('{')
-            info_end = info_response.rfind('}') + 1
-            if info_start != -1 and info_end != 0:
-                info_json = info_response[info_start:info_end]
-                info = json.loads(info_json)
-                
-                # Update collected_info with new info
-                self.collected_info.update({k: v for k, v in info.items() if v})
-                
-                # Add to conversation history
-                self.conversation_history.append({"role": "user", "content": user_input})
-                self.conversation_history.append({"role": "assistant", "content": info_response})
-                
-                return info
-        except (json.JSONDecodeError, ValueError):
-            pass
-        
-        return {}
-
-    def get_missing_fields(self):
-        """Get list of missing required fields"""
-        return [field for field in self.required_fields if field not in self.collected_info or not self.collected_info[field]]
-
-    def is_info_complete(self):
-        """Check if all required information is collected"""
-        return len(self.get_missing_fields()) == 0
-
-    def get_missing_fields_message(self):
-        """Get a user-friendly message about missing fields"""
-        missing = self.get_missing_fields()
-        if not missing:
-            return "All required information collected!"
-        
-        field_names = {
-            "source": "departure city/location",
-            "destination": "destination city/country",
-            "start_date": "start date of travel",
-            "end_date": "end date of travel",
-            "number_of_adults": "number of adults",
-            "budget_per_person": "budget per person",
-            "number_of_children": "number of children",
-            "travel_style": "travel style (economy/balanced/luxury)"
-        }
-        
-        missing_readable = [field_names.get(field, field) for field in missing]
-        return f"I still need the following information: {', '.join(missing_readable)}. Please provide these details."
-
-    def get_flights_info(self):
-        """Get flight information for the trip"""
-        try:
-            source = self.collected_info["source"]
-            destination = self.collected_info["destination"]
-            start_date = self.collected_info["start_date"]
-            end_date = self.collected_info["end_date"]
-            
-            # Get airport codes
-            prompt = f"""What is the short form of {source} airport to book flight from API? Just reply with the short form, nothing else. If there is no airport, reply with 'N/A'."""
-            source_code = self.llm.inference(prompt)
-            
-            if source_code.strip().upper() == "N/A":
-                return {"error": f"No airport found for source: {source}"}
-                
-            destination_code = self.llm.inference(prompt.replace(source, destination))
-            if destination_code.strip().upper() == "N/A":
-                return {"error": f"No airport found for destination: {destination}"}
-            
-            # Convert dates
-            prompt = f"""Convert the following date in YYYY-MM-DD format: {start_date}. Just reply with the date, nothing else. Assume that the current year is 2025"""
-            formatted_start_date = self.llm.inference(prompt)
-            
-            prompt = f"""Convert the following date in YYYY-MM-DD format: {end_date}. Just reply with the date, nothing else. Assume that the current year is 2025"""
-            formatted_end_date = self.llm.inference(prompt)
-            
-            # Search flights
-            start_flights = search_flights(source_code.strip(), destination_code.strip(), formatted_start_date.strip())
-            end_flights = search_flights(destination_code.strip(), source_code.strip(), formatted_end_date.strip())
-            
-            return {"start_flights": start_flights, "end_flights": end_flights}
-            
-        except Exception as e:
-            return {"error": f"Error getting flight information: {str(e)}"}
-
-    def find_best_flight(self, flights_info):
-        """Find the best flight based on budget and travel style"""
-        try:
-            budget_per_person = self.collected_info["budget_per_person"]
-            travel_style = self.collected_info.get("travel_style", "balanced")
-            
-            prompt = f"""
-            You are a flight booking assistant. Your task is to find the best flight based on user's budget and travel style.
-            
-            Budget per person: {budget_per_person}
-            Travel style: {travel_style}
-
-            Here are the available flights:
-            {json.dumps(flights_info)}
-
-            The best flight depends on both budget and travel style. For example, 
-            - if the travel style is "economy", prioritize cheaper flights even if they have longer durations, off timings or more stops.
-            - if the travel style is "luxury", prioritize shorter durations, better timings and fewer stops even if they are more expensive.
-            - if the travel style is "balanced", find a good compromise between cost and convenience.
-
-            Based on the above criteria, select the best flight and provide the details in the following format:
-            ```
-            {{
-                "ongoing_flight": {{
-                    "airline": "value",
-                    "price": "value",
-                    "duration": "value",
-                    "stops": "value",
-                    "departure": "value",
-                    "arrival": "value",
-                    "travel_class": "value"
-                }},
-                "return_flight": {{
-                    "airline": "value",
-                    "price": "value",
-                    "duration": "value",
-                    "stops": "value",
-                    "departure": "value",
-                    "arrival": "value",
-                    "travel_class": "value"
-                }}
-            }}
-            ```
-
-            Any response other than this format will be rejected by the system.
-            """
-            resp = self.llm.inference(prompt)
-            resp_start = resp.find('{')
-            resp_end = resp.rfind('}') + 1
-            if resp_start != -1 and resp_end != 0:
-                return json.loads(resp[resp_start:resp_end])
-            else:
-                return {"error": "Could not parse flight response"}
-        except Exception as e:
-            return {"error": f"Error finding best flight: {str(e)}"}
-
-    def get_hotels_info(self):
-        """Get hotel information for the trip"""
-        try:
-            destination = self.collected_info["destination"]
-            start_date = self.collected_info["start_date"]
-            end_date = self.collected_info["end_date"]
-            number_of_adults = self.collected_info["number_of_adults"]
-            number_of_children = self.collected_info["number_of_children"]
-            
-            # Convert dates
-            prompt = f"""Convert the following date in YYYY-MM-DD format: {start_date}. Just reply with the date, nothing else. Assume that the current year is 2025"""
-            formatted_start_date = self.llm.inference(prompt)
-            
-            prompt = f"""Convert the following date in YYYY-MM-DD format: {end_date}. Just reply with the date, nothing else. Assume that the current year is 2025"""
-            formatted_end_date = self.llm.inference(prompt)
-            
-            children_ages = "8," * int(number_of_children)
-            children_ages = children_ages[:-1] if children_ages else ""
-            
-            hotels = search_hotels(
-                location=destination,
-                check_in_date=formatted_start_date.strip(),
-                check_out_date=formatted_end_date.strip(),
-                adults=int(number_of_adults),
-                children=int(number_of_children),
-                children_ages=children_ages
-            )
-            return hotels
-        except Exception as e:
-            return {"error": f"Error getting hotel information: {str(e)}"}
-
-    def get_best_hotels(self, hotels_info):
-        """Find the best hotel based on budget and travel style"""
-        try:
-            budget_per_person = self.collected_info["budget_per_person"]
-            travel_style = self.collected_info.get("travel_style", "balanced")
-            
-            prompt = f"""
-            You are a hotel booking assistant. Your task is to find the best hotel based on user's budget and travel style.
-
-            Budget per person: {budget_per_person}
-            Travel style: {travel_style}
-
-            Here are the available hotels:
-            {json.dumps(hotels_info)}
-
-            The best hotel depends on both budget and travel style. For example,
-            - if the travel style is "economy", prioritize cheaper hotels even if they have fewer amenities or less desirable locations.
-            - if the travel style is "luxury", prioritize hotels with more amenities, better locations, and higher ratings even if they are more expensive.
-            - if the travel style is "balanced", find a good compromise between cost and quality.
-
-            Based on the above criteria, select the best hotel and provide the details in the following format:
-            ```
-            {{
-                "hotel": {{
-                    "name": "value",
-                    "price": "value",
-                    "rating": "value",
-                    "location": "value",
-                    "amenities": "value"
-                }}
-            }}
-            ```
-
-            Any response other than this format will be rejected by the system.
-            """
-            resp = self.llm.inference(prompt)
-            resp_start = resp.find('{')
-            resp_end = resp.rfind('}') + 1
-            if resp_start != -1 and resp_end != 0:
-                return json.loads(resp[resp_start:resp_end])
-            else:
-                return {"error": "Could not parse hotel response"}
-        except Exception as e:
-            return {"error": f"Error finding best hotel: {str(e)}"}
-
-    def create_itinerary(self, flights_info=None, hotels_info=None):
-        """Create detailed itinerary based on collected information"""
-        try:
-            destination = self.collected_info["destination"]
-            start_date = self.collected_info["start_date"]
-            end_date = self.collected_info["end_date"]
-            budget_per_person = self.collected_info["budget_per_person"]
-            travel_style = self.collected_info.get("travel_style", "balanced")
-            
-            gs = GoogleSearch()
-            results = {}
-            
-            search_queries = [
-                f"Must visit places in {destination}",
-                f"Crowd favourite places in {destination}",
-                f"Off beat places in {destination}",
-                f"Best food, drinks, restaurants to try in {destination}",
-                f"Best shopping places in {destination}"
-            ]
-            
-            for query in search_queries:
-                try:
-                    gs.search(query)
-                    first_link = gs.get_first_link()
-                    print(first_link)
-                    # Create a new event loop for this specific async call
-                    web_content = asyncio.run(get_data_from_url(first_link))
-                    
-                    prompt = f"""Search Query: {query}
-                    Webpage Content: {web_content}
-                    Extract the relevant information from the webpage content based on the search query.
-
-                    If possible extract the cost per person for each activity or place mentioned in the content.
-
-                    If there is no webpage content found, you can use your own knowledge to answer the query.
-                    """
-                    query_result = self.llm.inference(prompt)
-                    results[query] = query_result
-                except Exception as e:
-                    results[query] = f"Error retrieving information: {str(e)}"
-            # Convert dates
-            prompt = f"""Convert the following date in YYYY-MM-DD format: {start_date}. Just reply with the date, nothing else. Assume that the current year is 2025"""
-            formatted_start_date = self.llm.inference(prompt)
-            
-            prompt = f"""Convert the following date in YYYY-MM-DD format: {end_date}. Just reply with the date, nothing else. Assume that the current year is 2025"""
-            formatted_end_date = self.llm.inference(prompt)
-            best_destination = get_travel_destination(formatted_start_date, formatted_end_date, budget_per_person, os.getenv("WEATHER_KEY"))
-            
-            prompt = f"""
-            You are an excellent trip planner who is expert in creating detailed itineraries tailored to customer's need.
-
-            Based on the following information, create a detailed itinerary grouping the activities and places to visit for each day.
-
-            Try to include the places close to each other in the same day.
-
-            Information:
-            ```
-            Destination: {destination}
-            Start Date: {start_date}
-            End Date: {end_date}
-            Budget per person: {budget_per_person}
-            Travel style: {travel_style}
-            Flights Info: {flights_info}
-            Hotels Info: {hotels_info}
-            {results}
-            ```
-            
-            The budget mention by the user is in INR (Indian Rupees).
-            The cost of flights and hotels provided to you are in USD (US Dollars). Assume 1 USD = 83 INR for conversion.
-            
-            At the end of itinerary:
-            - Make a section to provide additional tips, must try food, sweets and beverages.
-            - Provide a summary of the total cost per person for the entire trip.
-            - Include the list of other important information like local transport, local customs and traditions etc.
-            - Include other famous places/activities which can be added to the itinerary based on user's feedback.
-            - Include the flight details and hotel details in the itinerary.
-
-            At the very end, also include that according to the dates, weather and budget, the best destination to visit is {best_destination}.
-            You are allowed to use knowledge of your own in addition to the information provided to create the itinerary.
-            """
-
-            final_itinerary = self.llm.inference(prompt)
-            return final_itinerary
-            
-        except Exception as e:
-            return f"Error creating itinerary: {str(e)}"
-
-    def reset_session(self):
-        """Reset the session data"""
-        self.collected_info = {}
-        self.conversation_history = []
+import os
+import re
+import json
+import orjson
+import asyncio
+import hashlib
+import functools
+import threading
+import streamlit as st
+from llm import LLM
+from dotenv import load_dotenv
+
+from utils import get_data_from_url
+from hotel_search import search_hotels
+from google_search import GoogleSearch
+from flight_search import search_flights, display_flights
+from weather import get_travel_destination
+
+load_dotenv()
+
+@st.cache_resource
+def get_event_loop():
+    """Persistent background event loop shared across reruns; avoids the cost of
+    creating and tearing down a loop on every async call"""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+def run_async(coro):
+    """Run a coroutine on the shared background loop and block for its result"""
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop()).result()
+
+@st.cache_resource
+def get_llm():
+    """Shared LLM client; cached so reruns and new sessions reuse the same HTTP client"""
+    return LLM(os.getenv("api_base"), os.getenv("deployment_name"), os.getenv("api_version"))
+
+# Grabs the outermost {...} block from an LLM response in one scan
+_JSON_RE = re.compile(rb"\{.*\}", re.DOTALL)
+
+def _extract_json(resp):
+    """Extract and parse the first JSON object from an LLM response, or None"""
+    m = _JSON_RE.search(resp.encode())
+    if not m:
+        return None
+    try:
+        return orjson.loads(m.group(0))
+    except orjson.JSONDecodeError:
+        return None
+
+def _prompt_key(prompt):
+    """Stable content hash for a prompt string or message list"""
+    payload = prompt if isinstance(prompt, str) else json.dumps(prompt, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+def _result_digest(result):
+    """Short stable digest of a stage result, for folding into cache keys"""
+    try:
+        return hashlib.sha256(orjson.dumps(result, default=str, option=orjson.OPT_SORT_KEYS)).hexdigest()[:16]
+    except TypeError:
+        return "unserializable"
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_inference(key, _prompt, response_format=None):
+    """LLM completion cached by prompt hash; identical prompts across reruns skip the API"""
+    return get_llm().inference(_prompt, response_format=response_format)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_travel_destination(start_date, end_date, budget_per_person):
+    """Weather-based destination suggestion cached per (dates, budget) for an hour"""
+    return get_travel_destination(start_date, end_date, budget_per_person, os.getenv("WEATHER_KEY"))
+
+@functools.lru_cache(maxsize=512)
+def _cached_format_date(llm, date_str):
+    """Convert a date to YYYY-MM-DD via the LLM, memoized since the same date repeats across stages"""
+    prompt = f"""Convert the following date in YYYY-MM-DD format: {date_str}. Just reply with the date, nothing else. Assume that the current year is 2025"""
+    return llm.inference(prompt).strip()
+
+@functools.lru_cache(maxsize=512)
+def _cached_format_dates(llm, start_date, end_date):
+    """Normalise both trip dates in a single JSON-mode LLM call, memoized per pair"""
+    prompt = f"""Convert start_date='{start_date}' and end_date='{end_date}' to YYYY-MM-DD format. Respond with a JSON object exactly as {{"start": "YYYY-MM-DD", "end": "YYYY-MM-DD"}}, nothing else. Assume that the current year is 2025"""
+    parsed = _extract_json(llm.inference(prompt, response_format={"type": "json_object"}))
+    if parsed and parsed.get("start") and parsed.get("end"):
+        return parsed["start"].strip(), parsed["end"].strip()
+    # Fall back to one call per date if the batched response is unusable
+    return _cached_format_date(llm, start_date), _cached_format_date(llm, end_date)
+
+@functools.lru_cache(maxsize=512)
+def _cached_airport_code(llm, city):
+    """Look up the airport code for a city via the LLM, memoized per city"""
+    prompt = f"""What is the short form of {city} airport to book flight from API? Just reply with the short form, nothing else. If there is no airport, reply with 'N/A'."""
+    return llm.inference(prompt).strip()
+
+# Static city -> IATA map for common destinations; avoids an LLM round-trip entirely
+IATA = {
+    "mumbai": "BOM",
+    "delhi": "DEL",
+    "new delhi": "DEL",
+    "bangalore": "BLR",
+    "bengaluru": "BLR",
+    "chennai": "MAA",
+    "kolkata": "CCU",
+    "hyderabad": "HYD",
+    "pune": "PNQ",
+    "ahmedabad": "AMD",
+    "goa": "GOI",
+    "jaipur": "JAI",
+    "kochi": "COK",
+    "lucknow": "LKO",
+    "london": "LHR",
+    "paris": "CDG",
+    "new york": "JFK",
+    "los angeles": "LAX",
+    "san francisco": "SFO",
+    "chicago": "ORD",
+    "dubai": "DXB",
+    "singapore": "SIN",
+    "bangkok": "BKK",
+    "tokyo": "HND",
+    "hong kong": "HKG",
+    "sydney": "SYD",
+    "amsterdam": "AMS",
+    "frankfurt": "FRA",
+    "rome": "FCO",
+    "madrid": "MAD",
+    "istanbul": "IST",
+    "kuala lumpur": "KUL",
+    "bali": "DPS",
+    "denpasar": "DPS",
+    "male": "MLE",
+    "colombo": "CMB",
+    "kathmandu": "KTM",
+    "zurich": "ZRH",
+    "toronto": "YYZ",
+    "seoul": "ICN",
+}
+
+def _airport_code(llm, city):
+    """Resolve a city to its IATA code: static map first, LLM lookup on miss"""
+    code = IATA.get(city.lower().strip())
+    if code:
+        return code
+    return _cached_airport_code(llm, city)
+
+def _price_value(price):
+    """Parse a price string like '$1,234' to a float; inf when unparseable"""
+    try:
+        return float(str(price).replace("$", "").replace(",", ""))
+    except (ValueError, TypeError):
+        return float("inf")
+
+def _compact_flights(flights, top_n=10):
+    """Keep only the schema-relevant fields of the cheapest top_n flights for the prompt"""
+    if not isinstance(flights, list):
+        return flights
+    return [{
+        "airline": f.airline,
+        "price": f.price,
+        "duration": f.duration,
+        "stops": f.stops,
+        "departure": f.departure,
+        "arrival": f.arrival,
+        "travel_class": f.travel_class
+    } for f in sorted(flights, key=lambda f: f.price_num)[:top_n]]
+
+def _compact_hotels(hotels, top_n=10):
+    """Keep only the schema-relevant fields of the cheapest top_n hotels for the prompt"""
+    if not isinstance(hotels, list):
+        return hotels
+    compact = [{
+        "name": h.get("name"),
+        "price_per_night": h.get("price_per_night"),
+        "total_price": h.get("total_price"),
+        "rating": h.get("rating"),
+        "hotel_class": h.get("hotel_class"),
+        "location": h.get("location"),
+        "amenities": h.get("amenities")
+    } for h in hotels]
+    return sorted(compact, key=lambda h: _price_value(h["price_per_night"]))[:top_n]
+
+class _StageError(Exception):
+    """Raised inside the cached stage functions so a transient failure is
+    surfaced to the caller instead of being stored for the cache TTL"""
+    def __init__(self, info):
+        super().__init__(info.get("error", "stage failed"))
+        self.info = info
+
+def _raise_if_error(result):
+    """Turn an {"error": ...} stage result into a _StageError; st.cache_data
+    only stores values returned normally, so errors stay uncached"""
+    if isinstance(result, dict) and "error" in result:
+        raise _StageError(result)
+    return result
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_flights(key, _backend):
+    """Flight search results memoized on the collected_info hash"""
+    return _raise_if_error(_backend.get_flights_info())
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_hotels(key, _backend):
+    """Hotel search results memoized on the collected_info hash"""
+    return _raise_if_error(_backend.get_hotels_info())
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_best_options(key, _backend, _flights_info, _hotels_info):
+    """Best flight/hotel selection memoized on the collected_info hash"""
+    return _raise_if_error(_backend._select_best_flight_and_hotel(_flights_info, _hotels_info))
+
+class TravelPlannerBackend:
+    # Tuple keeps the display/prompt order; the frozenset is used for set difference
+    REQUIRED_FIELDS = ("source", "destination", "start_date", "end_date", "number_of_adults", "budget_per_person", "number_of_children", "travel_style")
+
+    def __init__(self):
+        self.llm = get_llm()
+        self.required_fields = frozenset(self.REQUIRED_FIELDS)
+        self.collected_info = {}
+        self.conversation_history = []
+        self._missing = self.required_fields
+
+    def _stage_key(self, stage):
+        """Canonical per-stage cache key derived from the current collected_info"""
+        digest = hashlib.sha256(orjson.dumps(self.collected_info, option=orjson.OPT_SORT_KEYS)).hexdigest()
+        return f"{stage}:{digest}"
+
+    def _inference(self, prompt, json_mode=False):
+        """Run an LLM completion through the prompt-hash cache; json_mode asks the
+        API for a guaranteed JSON object instead of relying on parse-time rescue"""
+        response_format = {"type": "json_object"} if json_mode else None
+        return cached_inference(_prompt_key(prompt), prompt, response_format=response_format)
+
+    def extract_info_from_input(self, user_input):
+        """Extract travel information from user input using LLM"""
+        prompt = f"""
+        You are a data extraction agent. Your task is to extract the following fields from user input: {', '.join(self.REQUIRED_FIELDS)}.
+
+        User Input: {user_input}
+
+        Respond with a JSON object in the following format:
+        ```
+        {{
+            "source": "value",
+            "destination": "value",
+            "start_date": "value",
+            "end_date": "value",
+            "number_of_adults": "value",
+            "budget_per_person": "value",
+            "number_of_children": "value",
+            "travel_style": "value"
+        }}  
+        ```
+
+        If a field is not mentioned in the user input, do not include it in your response.
+        
+        Any response other than this format will be rejected by the system.
+        """
+        
+        # The extraction prompt is self-contained, so no conversation history is needed;
+        # collected_info remains the structured source of truth across turns
+        info_response = self._inference([{"role": "user", "content": prompt}], json_mode=True)
+
+        # Extract JSON from response
+        info = _extract_json(info_response)
+        if info is not None:
+            # Update collected_info with new info
+            self.collected_info.update({k: v for k, v in info.items() if v})
+            self._missing = self.required_fields - {k for k, v in self.collected_info.items() if v}
+            return info
+
+        return {}
+
+    def get_missing_fields(self):
+        """Get list of missing required fields, in display order"""
+        return [field for field in self.REQUIRED_FIELDS if field in self._missing]
+
+    def is_info_complete(self):
+        """Check if all required information is collected"""
+        return len(self.get_missing_fields()) == 0
+
+    def get_missing_fields_message(self):
+        """Get a user-friendly message about missing fields"""
+        missing = self.get_missing_fields()
+        if not missing:
+            return "All required information collected!"
+        
+        field_names = {
+            "source": "departure city/location",
+            "destination": "destination city/country",
+            "start_date": "start date of travel",
+            "end_date": "end date of travel",
+            "number_of_adults": "number of adults",
+            "budget_per_person": "budget per person",
+            "number_of_children": "number of children",
+            "travel_style": "travel style (economy/balanced/luxury)"
+        }
+        
+        missing_readable = [field_names.get(field, field) for field in missing]
+        return f"I still need the following information: {', '.join(missing_readable)}. Please provide these details."
+
+    def get_flights_info(self):
+        """Get flight information for the trip"""
+        try:
+            source = self.collected_info["source"]
+            destination = self.collected_info["destination"]
+            start_date = self.collected_info["start_date"]
+            end_date = self.collected_info["end_date"]
+            
+            # Get airport codes
+            source_code = _airport_code(self.llm, source)
+            if source_code.upper() == "N/A":
+                return {"error": f"No airport found for source: {source}"}
+
+            destination_code = _airport_code(self.llm, destination)
+            if destination_code.upper() == "N/A":
+                return {"error": f"No airport found for destination: {destination}"}
+
+            # Convert dates
+            formatted_start_date, formatted_end_date = _cached_format_dates(self.llm, start_date, end_date)
+
+            # Search flights
+            start_flights = search_flights(source_code, destination_code, formatted_start_date)
+            end_flights = search_flights(destination_code, source_code, formatted_end_date)
+            
+            return {"start_flights": start_flights, "end_flights": end_flights}
+            
+        except Exception as e:
+            return {"error": f"Error getting flight information: {str(e)}"}
+
+    async def get_flights_info_async(self):
+        """Async variant of get_flights_info; cached per trip and run in a thread"""
+        try:
+            return await asyncio.to_thread(cached_flights, self._stage_key("flights"), self)
+        except _StageError as e:
+            return e.info
+
+    def find_best_flight_and_hotel(self, flights_info, hotels_info):
+        """Cached entry point; recomputes only when the trip parameters or the
+        candidate flights/hotels change"""
+        # The underscore-prefixed inputs are excluded from st.cache_data
+        # hashing, so fold their digests into the key; otherwise a selection
+        # made while one search had failed (None on that side) would be
+        # replayed for the full TTL after the search recovers
+        key = f"{self._stage_key('best_options')}:{_result_digest(flights_info)}:{_result_digest(hotels_info)}"
+        try:
+            return cached_best_options(key, self, flights_info, hotels_info)
+        except _StageError as e:
+            return e.info
+
+    def _select_best_flight_and_hotel(self, flights_info, hotels_info):
+        """Find the best flight and hotel in a single LLM call based on budget and travel style"""
+        try:
+            budget_per_person = self.collected_info["budget_per_person"]
+            travel_style = self.collected_info.get("travel_style", "balanced")
+
+            # Send only the cheapest candidates with the fields the schema asks for;
+            # the raw SerpAPI payloads would dominate the prompt token count
+            if isinstance(flights_info, dict):
+                flights_info = {
+                    "start_flights": _compact_flights(flights_info.get("start_flights")),
+                    "end_flights": _compact_flights(flights_info.get("end_flights"))
+                }
+            hotels_info = _compact_hotels(hotels_info)
+
+            prompt = f"""
+            You are a travel booking assistant. Your task is to find the best flight and the best hotel based on user's budget and travel style.
+
+            Budget per person: {budget_per_person}
+            Travel style: {travel_style}
+
+            Here are the available flights:
+            {json.dumps(flights_info)}
+
+            Here are the available hotels:
+            {json.dumps(hotels_info)}
+
+            The best options depend on both budget and travel style. For example,
+            - if the travel style is "economy", prioritize cheaper flights and hotels even if they have longer durations, more stops or fewer amenities.
+            - if the travel style is "luxury", prioritize shorter durations, fewer stops, better locations and higher ratings even if they are more expensive.
+            - if the travel style is "balanced", find a good compromise between cost and convenience.
+
+            Based on the above criteria, select the best flight and hotel and provide the details as a JSON object in the following format:
+            ```
+            {{
+                "ongoing_flight": {{
+                    "airline": "value",
+                    "price": "value",
+                    "duration": "value",
+                    "stops": "value",
+                    "departure": "value",
+                    "arrival": "value",
+                    "travel_class": "value"
+                }},
+                "return_flight": {{
+                    "airline": "value",
+                    "price": "value",
+                    "duration": "value",
+                    "stops": "value",
+                    "departure": "value",
+                    "arrival": "value",
+                    "travel_class": "value"
+                }},
+                "hotel": {{
+                    "name": "value",
+                    "price": "value",
+                    "rating": "value",
+                    "location": "value",
+                    "amenities": "value"
+                }}
+            }}
+            ```
+
+            If the flights or hotels list is empty or missing, set the corresponding fields to null.
+
+            Any response other than this format will be rejected by the system.
+            """
+            resp = self._inference(prompt, json_mode=True)
+            best_options = _extract_json(resp)
+            if best_options is not None:
+                return best_options
+            else:
+                return {"error": "Could not parse booking response"}
+        except Exception as e:
+            return {"error": f"Error finding best flight and hotel: {str(e)}"}
+
+    def get_hotels_info(self):
+        """Get hotel information for the trip"""
+        try:
+            destination = self.collected_info["destination"]
+            start_date = self.collected_info["start_date"]
+            end_date = self.collected_info["end_date"]
+            number_of_adults = self.collected_info["number_of_adults"]
+            number_of_children = self.collected_info["number_of_children"]
+            
+            # Convert dates
+            formatted_start_date, formatted_end_date = _cached_format_dates(self.llm, start_date, end_date)
+
+            children_ages = "8," * int(number_of_children)
+            children_ages = children_ages[:-1] if children_ages else ""
+
+            hotels = search_hotels(
+                location=destination,
+                check_in_date=formatted_start_date,
+                check_out_date=formatted_end_date,
+                adults=int(number_of_adults),
+                children=int(number_of_children),
+                children_ages=children_ages
+            )
+            return hotels
+        except Exception as e:
+            return {"error": f"Error getting hotel information: {str(e)}"}
+
+    async def get_hotels_info_async(self):
+        """Async variant of get_hotels_info; cached per trip and run in a thread"""
+        try:
+            return await asyncio.to_thread(cached_hotels, self._stage_key("hotels"), self)
+        except _StageError as e:
+            return e.info
+
+    def _build_itinerary_prompt(self, flights_info=None, hotels_info=None):
+        """Gather research, weather and dates, then build the final itinerary prompt"""
+        destination = self.collected_info["destination"]
+        start_date = self.collected_info["start_date"]
+        end_date = self.collected_info["end_date"]
+        budget_per_person = self.collected_info["budget_per_person"]
+        travel_style = self.collected_info.get("travel_style", "balanced")
+        
+        results = {}
+
+        search_queries = [
+            f"Must visit places in {destination}",
+            f"Crowd favourite places in {destination}",
+            f"Off beat places in {destination}",
+            f"Best food, drinks, restaurants to try in {destination}",
+            f"Best shopping places in {destination}"
+        ]
+
+        async def _process_query(query):
+            # Each query gets its own GoogleSearch since the client stores the last result
+            gs = GoogleSearch()
+            await gs.search(query)
+            first_link = gs.get_first_link()
+            print(first_link)
+            web_content = await asyncio.to_thread(get_data_from_url, first_link)
+
+            prompt = f"""Search Query: {query}
+            Webpage Content: {web_content}
+            Extract the relevant information from the webpage content based on the search query.
+
+            If possible extract the cost per person for each activity or place mentioned in the content.
+
+            If there is no webpage content found, you can use your own knowledge to answer the query.
+            """
+            return await asyncio.to_thread(self._inference, prompt)
+
+        async def _process_all_queries():
+            # The 5 queries are independent and IO-bound, so fan them out on one event loop
+            return await asyncio.gather(
+                *[_process_query(query) for query in search_queries],
+                return_exceptions=True
+            )
+
+        for query, query_result in zip(search_queries, run_async(_process_all_queries())):
+            if isinstance(query_result, Exception):
+                results[query] = f"Error retrieving information: {str(query_result)}"
+            else:
+                results[query] = query_result
+        # Convert dates
+        formatted_start_date, formatted_end_date = _cached_format_dates(self.llm, start_date, end_date)
+        best_destination = cached_travel_destination(formatted_start_date, formatted_end_date, budget_per_person)
+        
+        prompt = f"""
+        You are an excellent trip planner who is expert in creating detailed itineraries tailored to customer's need.
+
+        Based on the following information, create a detailed itinerary grouping the activities and places to visit for each day.
+
+        Try to include the places close to each other in the same day.
+
+        Information:
+        ```
+        Destination: {destination}
+        Start Date: {start_date}
+        End Date: {end_date}
+        Budget per person: {budget_per_person}
+        Travel style: {travel_style}
+        Flights Info: {flights_info}
+        Hotels Info: {hotels_info}
+        {results}
+        ```
+        
+        The budget mention by the user is in INR (Indian Rupees).
+        The cost of flights and hotels provided to you are in USD (US Dollars). Assume 1 USD = 83 INR for conversion.
+        
+        At the end of itinerary:
+        - Make a section to provide additional tips, must try food, sweets and beverages.
+        - Provide a summary of the total cost per person for the entire trip.
+        - Include the list of other important information like local transport, local customs and traditions etc.
+        - Include other famous places/activities which can be added to the itinerary based on user's feedback.
+        - Include the flight details and hotel details in the itinerary.
+
+        At the very end, also include that according to the dates, weather and budget, the best destination to visit is {best_destination}.
+        You are allowed to use knowledge of your own in addition to the information provided to create the itinerary.
+        """
+
+        return prompt
+
+    def create_itinerary(self, flights_info=None, hotels_info=None):
+        """Create detailed itinerary based on collected information"""
+        try:
+            prompt = self._build_itinerary_prompt(flights_info, hotels_info)
+            return self._inference(prompt)
+        except Exception as e:
+            return f"Error creating itinerary: {str(e)}"
+
+    def create_itinerary_stream(self, flights_info=None, hotels_info=None):
+        """Stream the itinerary as it is generated so the UI can render tokens incrementally"""
+        try:
+            prompt = self._build_itinerary_prompt(flights_info, hotels_info)
+            # Contain mid-stream failures too; an uncaught exception here would
+            # propagate through st.write_stream and abort the script run
+            yield from self.llm.inference_stream(prompt)
+        except Exception as e:
+            yield f"Error creating itinerary: {str(e)}"
+
+    def reset_session(self):
+        """Reset the session data"""
+        self.collected_info = {}
+        self.conversation_history = []
+        self._missing = self.required_fields
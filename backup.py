@@ -1,253 +1,425 @@
-import os
-import json
-import asyncio
-from llm import LLM
-from dotenv import load_dotenv
-
-from utils import get_data_from_url
-from hotel_search import search_hotels
-from google_search import GoogleSearch
-from flight_search import search_flights, display_flights
-
-load_dotenv()
-
-async def itinerary(destination, start_date, end_date, budget_per_person, travel_style="balanced", flights_info=None):
-    gs = GoogleSearch()
-    llm = LLM(os.getenv("api_base"), os.getenv("deployment_name"), os.getenv("api_version"))
-    results = {}
-    search_queries = [f"Must visit places in {destination}", f"Crowd favourite places in {destination}", f"Off beat places in {destination}", f"Best food, drinks, restaurants to try in {destination}", f"Best shopping places in {destination}"]
-    for query in search_queries:
-        print("Querying:", query)
-        gs.search(query)
-        first_link = gs.get_first_link()
-        web_content = await get_data_from_url(first_link)
-        print("Web content extracted")
-        prompt = f"""Search Query: {query}
-        Webpage Content: {web_content}
-        Extract the relevant information from the webpage content based on the search query.
-
-        If possible extract the cost per person for each activity or place mentioned in the content.
-
-        If there is no webpage content found, you can use your own knowledge to answer the query.
-        """
-        query_result = llm.inference(prompt)
-        # print(result)
-        print("LLM call ended")
-        results[query] = query_result
-    
-    prompt = f"""
-    You are an excellent trip planner who is expert in creating detailed itineraries tailored to customer's need.
-
-    Based on the following information, create a detailed itinerary grouping the activities and places to visit for each day.
-
-    Try to include the places close to each other in the same day.
-
-    Information:
-    Destination: {destination}
-    Start Date: {start_date}
-    End Date: {end_date}
-    Budget per person: {budget_per_person}
-    Travel style: {travel_style}
-    Flights Info: {flights_info}
-    {results}
-    
-    At the end, provide additional tips, must try food, sweets and beverages and summary of the total cost per person for the entire trip.
-
-    Also include the list of other important information like local transport, local customs and traditions etc.
-
-    Also include other famous places/activities which can be added to the itinerary based on user's feedback.
-
-    You are allowed to use knowledge of your own in addition to the information provided to create the itinerary.
-    """
-
-    final_itinerary = llm.inference(prompt)
-    print("Final Itinerary created")
-    print(final_itinerary)
-
-def extract_info():
-    llm = LLM(os.getenv("api_base"), os.getenv("deployment_name"), os.getenv("api_version"))
-    required_fields = ["source", "destination", "start_date", "end_date", "number_of_adults", "budget_per_person", "number_of_children", "travel_style"]
-    collected_info = {}
-    conversation = []
-    while True:
-        # Ask user for input
-        user_input = input("Please enter your request: ")
-        prompt = f"""
-        You are a data extraction agent. Your task is to extract the following fields from user input: {', '.join(required_fields)}.
-
-        User Input: {user_input}
-
-        Response Format:
-        ```
-        {{
-            "source": "value",
-            "destination": "value",
-            "start_date": "value",
-            "end_date": "value",
-            "number_of_adults": "value",
-            "budget_per_person": "value",
-            "number_of_children": "value",
-            "travel_style": "value"
-        }}  
-        ```
-
-        If a field is not mentioned in the user input, do not include it in your response.
-        
-        Any response other than this format will be rejected by the system.
-        """
-        conversation.append({"role": "user", "content": prompt})
-        # Use LLM to extract info (simulate with a dict for now)
-        info = llm.inference(conversation)  # Should return a dict with extracted fields
-        conversation.append({"role": "assistant", "content": info})
-        info = info[info.find('{'):info.find("}") + 1]
-        print(info)
-        info = json.loads(info)
-
-        # Update collected_info with new info
-        collected_info.update({k: v for k, v in info.items() if v})
-
-        # Find missing fields
-        missing = [field for field in required_fields if field not in collected_info or not collected_info[field]]
-        if not missing:
-            print("All required information collected:", collected_info)
-            break
-        else:
-            llm_resp = f"Missing information: {', '.join(missing)}. Please provide these."
-            conversation.append({"role": "assistant", "content": llm_resp})
-            print(llm_resp)
-    return collected_info
-
-def get_flights_info(source, destination, start_date, end_date):
-    llm = LLM(os.getenv("api_base"), os.getenv("deployment_name"), os.getenv("api_version"))
-    prompt = f"""What is the short form of {source} airport to book flight from API? Just reply with the short form, nothing else. If there is no aiport, reply with 'N/A'."""
-    source_code = llm.inference(prompt)
-    if source_code.strip().upper() == "N/A":
-        print(f"No airport found for source: {source}")
-        return []
-    destination_code = llm.inference(prompt.replace(source, destination))
-    if destination_code.strip().upper() == "N/A":
-        print(f"No airport found for destination: {destination}")
-        return []
-    prompt = f"""Convert the following date in YYYY-MM-DD format: {start_date}. Just reply with the date, nothing else. Assume that the current year is 2025"""
-    start_date = llm.inference(prompt)
-    prompt = f"""Convert the following date in YYYY-MM-DD format: {end_date}. Just reply with the date, nothing else. Assume that the current year is 2025"""
-    end_date = llm.inference(prompt)
-    start_flights = search_flights(source_code.strip(), destination_code.strip(), start_date)
-    end_flights = search_flights(source_code.strip(), destination_code.strip(), end_date)
-    return {"start_flights": start_flights, "end_flights": end_flights}
-
-def find_best_flight(flights, budget_per_person, travel_style="balanced"):
-    llm = LLM(os.getenv("api_base"), os.getenv("deployment_name"), os.getenv("api_version"))
-    prompt = f"""
-    You are a flight booking assistant. Your task is to find the best flight based on user's budge and travel style.
-    
-    Budget per person: {budget_per_person}
-    Travel style: {travel_style}
-
-    Here are the available flights:
-    {json.dumps(flights)}
-
-    The best flight depends on both budget and travel style. For example, 
-    - if the travel style is "economy", prioritize cheaper flights even if they have longer durations, off timings or more stops.
-    - if the travel style is "luxury", prioritize shorter durations, better timings and fewer stops even if they are more expensive.
-    - if the travel style is "balanced", find a good compromise between cost and convenience.
-
-    Based on the above criteria, select the best flight and provide the details in the following format:
-    ```
-    {{
-        "ongoing_flight": {{
-            "airline": "value",
-            "price": "value",
-            "duration": "value",
-            "stops": "value",
-            "departure": "value",
-            "arrival": "value",
-            "travel_class": "value"
-        }},
-        "return_flight": {{
-            "airline": "value",
-            "price": "value",
-            "duration": "value",
-            "stops": "value",
-            "departure": "value",
-            "arrival": "value",
-            "travel_class": "value"
-        }}
-    }}
-    ```
-
-    Any response other than this format will be rejected by the system.
-    """
-    resp = llm.inference(prompt)
-    resp = resp[resp.find('{'):resp.rfind("}") + 1]
-    return resp
-
-def get_hotels_info(destination, start_date, end_date, number_of_adults, number_of_children):
-    llm= LLM(os.getenv("api_base"), os.getenv("deployment_name"), os.getenv("api_version"))
-    prompt = f"""Convert the following date in YYYY-MM-DD format: {start_date}. Just reply with the date, nothing else. Assume that the current year is 2025"""
-    start_date = llm.inference(prompt)
-    prompt = f"""Convert the following date in YYYY-MM-DD format: {end_date}. Just reply with the date, nothing else. Assume that the current year is 2025"""
-    end_date = llm.inference(prompt)
-    children_ages = "8,"*int(number_of_children)
-    children_ages = children_ages[:-1]
-    hotels = search_hotels(
-        location=destination,
-        check_in_date=start_date,
-        check_out_date=end_date,
-        adults=int(number_of_adults),
-        children=int(number_of_children),
-        children_ages=children_ages
-    )
-    return hotels
-
-def get_best_hotels(hotels, budget_per_person, travel_style="balanced"):
-    llm = LLM(os.getenv("api_base"), os.getenv("deployment_name"), os.getenv("api_version"))
-    prompt = f"""
-    You are a hotel booking assistant. Your task is to find the best hotel based on user's budget and travel style.
-
-    Budget per person: {budget_per_person}
-    Travel style: {travel_style}
-
-    Here are the available hotels:
-    {json.dumps(hotels)}
-
-    The best hotel depends on both budget and travel style. For example,
-    - if the travel style is "economy", prioritize cheaper hotels even if they have fewer amenities or less desirable locations.
-    - if the travel style is "luxury", prioritize hotels with more amenities, better locations, and higher ratings even if they are more expensive.
-    - if the travel style is "balanced", find a good compromise between cost and quality.
-
-    Based on the above criteria, select the best hotel and provide the details in the following format:
-    ```
-    {{
-        "hotel": {{
-            "name": "value",
-            "price": "value",
-            "rating": "value",
-            "location": "value",
-            "amenities": "value"
-        }}
-    }}
-    ```
-
-    Any response other than this format will be rejected by the system.
-    """
-    resp = llm.inference(prompt)
-    resp = resp[resp.find('{'):resp.rfind("}") + 1]
-    return resp
-
-async def get_user_info():
-    # Extract user information
-    collected_info = extract_info()
-
-    # Extract the flights information
-    flights_info = get_flights_info(collected_info["source"], collected_info["destination"], collected_info["start_date"], collected_info["end_date"])
-    best_flights = find_best_flight(flights_info, collected_info["budget_per_person"], travel_style="balanced")
-
-    # Extract the hotels information
-    hotels_info = get_hotels_info(collected_info["destination"], collected_info["start_date"], collected_info["end_date"], collected_info["number_of_adults"], collected_info["number_of_children"])
-    best_hotels = get_best_hotels(hotels_info, collected_info["budget_per_person"], travel_style="balanced")
-
-    # Create the itinerary
-    await itinerary(collected_info["destination"], collected_info["start_date"], collected_info["end_date"], collected_info["budget_per_person"], best_flights, best_hotels)
-
+import os
+import re
+import orjson
+import asyncio
+import functools
+from datetime import datetime
+from dateutil import parser as dateparser
+from llm import LLM
+from dotenv import load_dotenv
+
+from utils import get_data_from_url
+from hotel_search import search_hotels
+from google_search import GoogleSearch
+from flight_search import search_flights, display_flights
+
+load_dotenv()
+
+# Read the Azure settings once at import instead of per call
+_API_BASE = os.getenv("api_base")
+_DEPLOYMENT_NAME = os.getenv("deployment_name")
+_API_VERSION = os.getenv("api_version")
+
+@functools.lru_cache(maxsize=1)
+def _get_llm():
+    """Single shared LLM client so every helper reuses one connection pool"""
+    return LLM(_API_BASE, _DEPLOYMENT_NAME, _API_VERSION)
+
+def _extract_json(text):
+    """Return the first balanced {...} block from an LLM response.
+
+    One forward scan with a depth counter; handles nested braces that the old
+    find('{')/find('}') slicing truncated."""
+    start = text.find('{')
+    if start == -1:
+        return ""
+    depth = 0
+    for i in range(start, len(text)):
+        if text[i] == '{':
+            depth += 1
+        elif text[i] == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return text[start:]
+
+def _normalize_date(date_str, llm=None):
+    """Normalize a date string to YYYY-MM-DD with dateutil; the LLM is only a
+    fallback for inputs dateutil cannot parse"""
+    try:
+        return dateparser.parse(date_str, default=datetime(2025, 1, 1)).strftime('%Y-%m-%d')
+    except (dateparser.ParserError, OverflowError, TypeError):
+        if llm is None:
+            llm = _get_llm()
+        prompt = f"""Convert the following date in YYYY-MM-DD format: {date_str}. Just reply with the date, nothing else. Assume that the current year is 2025"""
+        return llm.inference(prompt).strip()
+
+# Common city → IATA codes; popular inputs never cost an LLM call
+_IATA_SEED = {
+    "mumbai": "BOM",
+    "delhi": "DEL",
+    "new delhi": "DEL",
+    "bangalore": "BLR",
+    "bengaluru": "BLR",
+    "chennai": "MAA",
+    "kolkata": "CCU",
+    "hyderabad": "HYD",
+    "pune": "PNQ",
+    "ahmedabad": "AMD",
+    "goa": "GOI",
+    "jaipur": "JAI",
+    "kochi": "COK",
+    "lucknow": "LKO",
+    "london": "LHR",
+    "paris": "CDG",
+    "new york": "JFK",
+    "los angeles": "LAX",
+    "san francisco": "SFO",
+    "chicago": "ORD",
+    "dubai": "DXB",
+    "singapore": "SIN",
+    "bangkok": "BKK",
+    "tokyo": "HND",
+    "hong kong": "HKG",
+    "sydney": "SYD",
+    "amsterdam": "AMS",
+    "frankfurt": "FRA",
+    "rome": "FCO",
+    "madrid": "MAD",
+    "istanbul": "IST",
+    "kuala lumpur": "KUL",
+    "bali": "DPS",
+    "denpasar": "DPS",
+    "male": "MLE",
+    "colombo": "CMB",
+    "kathmandu": "KTM",
+    "zurich": "ZRH",
+    "toronto": "YYZ",
+    "seoul": "ICN",
+}
+
+@functools.lru_cache(maxsize=4096)
+def _city_to_iata(city):
+    """Resolve a city to its IATA code: seed table first, memoized LLM on miss"""
+    code = _IATA_SEED.get(city.strip().lower())
+    if code:
+        return code
+    llm = _get_llm()
+    prompt = f"""IATA airport code for {city}, or 'N/A' if it has no airport. Reply with 3 letters only."""
+    return llm.inference(prompt).strip().upper()
+
+# Speculative search results keyed by query, filled while the user is typing
+_search_cache = {}
+
+# Live references to background tasks; the event loop only keeps weak ones,
+# so an unreferenced task can be garbage-collected before it finishes
+_background_tasks = set()
+
+def _itinerary_queries(destination):
+    return [f"Must visit places in {destination}", f"Crowd favourite places in {destination}", f"Off beat places in {destination}", f"Best food, drinks, restaurants to try in {destination}", f"Best shopping places in {destination}"]
+
+async def _fetch_web_content(query):
+    """Search the query and scrape the first result"""
+    print("Querying:", query)
+    # One GoogleSearch per task since the client stores the last result on itself
+    gs = GoogleSearch()
+    await gs.search(query)
+    first_link = gs.get_first_link()
+    web_content = await asyncio.to_thread(get_data_from_url, first_link)
+    print("Web content extracted")
+    return web_content
+
+async def _prewarm_searches(destination):
+    """Speculatively run the itinerary searches in the background so the results
+    are already cached by the time the user finishes entering their trip"""
+    sem = asyncio.Semaphore(3)
+
+    async def _prewarm(query):
+        async with sem:
+            if query not in _search_cache:
+                try:
+                    _search_cache[query] = await _fetch_web_content(query)
+                except Exception as error:
+                    print("Prewarm failed:", error)
+
+    await asyncio.gather(*[_prewarm(query) for query in _itinerary_queries(destination)])
+
+async def itinerary(destination, start_date, end_date, budget_per_person, travel_style="balanced", flights_info=None):
+    llm = _get_llm()
+    search_queries = _itinerary_queries(destination)
+    # Cap concurrency while the independent queries run in parallel
+    sem = asyncio.Semaphore(5)
+
+    async def _fetch_query(query):
+        async with sem:
+            # Reuse prewarmed results when available
+            web_content = _search_cache.get(query)
+            if web_content is None:
+                web_content = await _fetch_web_content(query)
+                _search_cache[query] = web_content
+            return query, web_content
+
+    pairs = await asyncio.gather(*[_fetch_query(query) for query in search_queries])
+
+    # Batch the 5 extractions into one LLM call; blocks are tagged [i] so the
+    # response can be split back per query
+    blocks = "\n\n".join(f"[{i}] Search Query: {query}\nWebpage Content: {content}" for i, (query, content) in enumerate(pairs, 1))
+    batched_prompt = f"""For each numbered block below, extract the relevant information from the webpage content based on its search query.
+
+    If possible extract the cost per person for each activity or place mentioned in the content.
+
+    If there is no webpage content found, you can use your own knowledge to answer the query.
+
+    Start each answer with its block number like [1], [2], ... on its own line.
+
+    {blocks}
+    """
+    resp = await asyncio.to_thread(llm.inference, batched_prompt)
+    print("LLM call ended")
+
+    # re.split yields [prefix, '1', answer1, '2', answer2, ...]
+    sections = re.split(r'\[(\d+)\]\s*', resp)
+    results = {query: "" for query, _ in pairs}
+    for idx, answer in zip(sections[1::2], sections[2::2]):
+        i = int(idx) - 1
+        if 0 <= i < len(pairs):
+            results[pairs[i][0]] = answer.strip()
+
+    prompt = f"""
+    You are an excellent trip planner who is expert in creating detailed itineraries tailored to customer's need.
+
+    Based on the following information, create a detailed itinerary grouping the activities and places to visit for each day.
+
+    Try to include the places close to each other in the same day.
+
+    Information:
+    Destination: {destination}
+    Start Date: {start_date}
+    End Date: {end_date}
+    Budget per person: {budget_per_person}
+    Travel style: {travel_style}
+    Flights Info: {flights_info}
+    {results}
+    
+    At the end, provide additional tips, must try food, sweets and beverages and summary of the total cost per person for the entire trip.
+
+    Also include the list of other important information like local transport, local customs and traditions etc.
+
+    Also include other famous places/activities which can be added to the itinerary based on user's feedback.
+
+    You are allowed to use knowledge of your own in addition to the information provided to create the itinerary.
+    """
+
+    final_itinerary = llm.inference(prompt)
+    print("Final Itinerary created")
+    print(final_itinerary)
+
+async def extract_info():
+    llm = _get_llm()
+    required_fields = ["source", "destination", "start_date", "end_date", "number_of_adults", "budget_per_person", "number_of_children", "travel_style"]
+    collected_info = {}
+    conversation = []
+    while True:
+        # Ask user for input; run in a thread so waiting on the keyboard does
+        # not block the event loop
+        user_input = await asyncio.to_thread(input, "Please enter your request: ")
+        prompt = f"""
+        You are a data extraction agent. Your task is to extract the following fields from user input: {', '.join(required_fields)}.
+
+        User Input: {user_input}
+
+        Response Format:
+        ```
+        {{
+            "source": "value",
+            "destination": "value",
+            "start_date": "value",
+            "end_date": "value",
+            "number_of_adults": "value",
+            "budget_per_person": "value",
+            "number_of_children": "value",
+            "travel_style": "value"
+        }}  
+        ```
+
+        If a field is not mentioned in the user input, do not include it in your response.
+        
+        Any response other than this format will be rejected by the system.
+        """
+        conversation.append({"role": "user", "content": prompt})
+        # Use LLM to extract info (simulate with a dict for now)
+        info = await asyncio.to_thread(llm.inference, conversation)  # Should return a dict with extracted fields
+        conversation.append({"role": "assistant", "content": info})
+        info = _extract_json(info)
+        print(info)
+        info = orjson.loads(info)
+
+        # Update collected_info with new info
+        had_destination = bool(collected_info.get("destination"))
+        collected_info.update({k: v for k, v in info.items() if v})
+
+        # As soon as the destination is known, warm the itinerary searches in
+        # the background while the user keeps typing
+        if not had_destination and collected_info.get("destination"):
+            task = asyncio.create_task(_prewarm_searches(collected_info["destination"]))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
+
+        # Find missing fields
+        missing = [field for field in required_fields if field not in collected_info or not collected_info[field]]
+        if not missing:
+            print("All required information collected:", collected_info)
+            break
+        else:
+            llm_resp = f"Missing information: {', '.join(missing)}. Please provide these."
+            conversation.append({"role": "assistant", "content": llm_resp})
+            print(llm_resp)
+    return collected_info
+
+async def get_flights_info(source, destination, start_date, end_date):
+    llm = _get_llm()
+    # Airport codes come from the memoized lookup; repeat cities are free
+    # Only hit SerpAPI with well-formed IATA codes; anything else (N/A, empty,
+    # hallucinated text) would burn quota on a search that cannot succeed
+    source_code = _city_to_iata(source)
+    if not re.fullmatch(r'[A-Z]{3}', source_code):
+        print(f"No airport found for source: {source}")
+        return []
+    destination_code = _city_to_iata(destination)
+    if not re.fullmatch(r'[A-Z]{3}', destination_code):
+        print(f"No airport found for destination: {destination}")
+        return []
+    start_date = _normalize_date(start_date, llm)
+    end_date = _normalize_date(end_date, llm)
+    # The outbound and return searches are independent, so run them concurrently
+    start_flights, end_flights = await asyncio.gather(
+        asyncio.to_thread(search_flights, source_code, destination_code, start_date),
+        asyncio.to_thread(search_flights, source_code, destination_code, end_date)
+    )
+    return {"start_flights": start_flights, "end_flights": end_flights}
+
+# Fields the selection prompt actually needs; drops airline_logo URLs
+_FLIGHT_PROMPT_FIELDS = ("airline", "price", "duration", "stops", "departure", "arrival", "travel_class")
+
+def _compact_flights(flights):
+    """Reduce flight records to the prompt-relevant fields before JSON-dumping"""
+    if isinstance(flights, dict):
+        return {key: _compact_flights(value) for key, value in flights.items()}
+    if isinstance(flights, list):
+        return [{field: getattr(flight, field) for field in _FLIGHT_PROMPT_FIELDS} for flight in flights]
+    return flights
+
+def find_best_flight(flights, budget_per_person, travel_style="balanced"):
+    llm = _get_llm()
+    prompt = f"""
+    You are a flight booking assistant. Your task is to find the best flight based on user's budge and travel style.
+    
+    Budget per person: {budget_per_person}
+    Travel style: {travel_style}
+
+    Here are the available flights:
+    {orjson.dumps(_compact_flights(flights)).decode()}
+
+    The best flight depends on both budget and travel style. For example, 
+    - if the travel style is "economy", prioritize cheaper flights even if they have longer durations, off timings or more stops.
+    - if the travel style is "luxury", prioritize shorter durations, better timings and fewer stops even if they are more expensive.
+    - if the travel style is "balanced", find a good compromise between cost and convenience.
+
+    Based on the above criteria, select the best flight and provide the details in the following format:
+    ```
+    {{
+        "ongoing_flight": {{
+            "airline": "value",
+            "price": "value",
+            "duration": "value",
+            "stops": "value",
+            "departure": "value",
+            "arrival": "value",
+            "travel_class": "value"
+        }},
+        "return_flight": {{
+            "airline": "value",
+            "price": "value",
+            "duration": "value",
+            "stops": "value",
+            "departure": "value",
+            "arrival": "value",
+            "travel_class": "value"
+        }}
+    }}
+    ```
+
+    Any response other than this format will be rejected by the system.
+    """
+    resp = llm.inference(prompt)
+    return _extract_json(resp)
+
+def get_hotels_info(destination, start_date, end_date, number_of_adults, number_of_children):
+    llm = _get_llm()
+    start_date = _normalize_date(start_date, llm)
+    end_date = _normalize_date(end_date, llm)
+    children_ages = "8,"*int(number_of_children)
+    children_ages = children_ages[:-1]
+    hotels = search_hotels(
+        location=destination,
+        check_in_date=start_date,
+        check_out_date=end_date,
+        adults=int(number_of_adults),
+        children=int(number_of_children),
+        children_ages=children_ages
+    )
+    return hotels
+
+def get_best_hotels(hotels, budget_per_person, travel_style="balanced"):
+    llm = _get_llm()
+    prompt = f"""
+    You are a hotel booking assistant. Your task is to find the best hotel based on user's budget and travel style.
+
+    Budget per person: {budget_per_person}
+    Travel style: {travel_style}
+
+    Here are the available hotels:
+    {orjson.dumps(hotels).decode()}
+
+    The best hotel depends on both budget and travel style. For example,
+    - if the travel style is "economy", prioritize cheaper hotels even if they have fewer amenities or less desirable locations.
+    - if the travel style is "luxury", prioritize hotels with more amenities, better locations, and higher ratings even if they are more expensive.
+    - if the travel style is "balanced", find a good compromise between cost and quality.
+
+    Based on the above criteria, select the best hotel and provide the details in the following format:
+    ```
+    {{
+        "hotel": {{
+            "name": "value",
+            "price": "value",
+            "rating": "value",
+            "location": "value",
+            "amenities": "value"
+        }}
+    }}
+    ```
+
+    Any response other than this format will be rejected by the system.
+    """
+    resp = llm.inference(prompt)
+    return _extract_json(resp)
+
+async def get_user_info():
+    # Extract user information
+    collected_info = await extract_info()
+
+    # Flights and hotels are independent pipelines; only the itinerary needs both
+    async def _flights_pipeline():
+        flights_info = await get_flights_info(collected_info["source"], collected_info["destination"], collected_info["start_date"], collected_info["end_date"])
+        return await asyncio.to_thread(find_best_flight, flights_info, collected_info["budget_per_person"], "balanced")
+
+    async def _hotels_pipeline():
+        hotels_info = await asyncio.to_thread(get_hotels_info, collected_info["destination"], collected_info["start_date"], collected_info["end_date"], collected_info["number_of_adults"], collected_info["number_of_children"])
+        return await asyncio.to_thread(get_best_hotels, hotels_info, collected_info["budget_per_person"], "balanced")
+
+    best_flights, best_hotels = await asyncio.gather(_flights_pipeline(), _hotels_pipeline())
+
+    # Create the itinerary
+    await itinerary(collected_info["destination"], collected_info["start_date"], collected_info["end_date"], collected_info["budget_per_person"], best_flights, best_hotels)
+
 asyncio.run(get_user_info())
\ No newline at end of file
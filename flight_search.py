@@ -6,31 +6,44 @@ It can be used independently without any server infrastructure.
 """
 
 import os
+import requests
+from dataclasses import dataclass
 from typing import Dict, Any, List, Optional
-from serpapi import GoogleSearch
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Read the key once at import; validity is still checked per search call
+_SERP_API_KEY = os.getenv("SERP_API_KEY")
+
+# Shared keep-alive session so concurrent/repeated searches reuse one
+# TLS connection to serpapi.com instead of handshaking per call
+_SERP_SESSION = requests.Session()
+_SERP_ENDPOINT = "https://serpapi.com/search.json"
+
 
 def search_flights(
-    origin: str, 
-    destination: str, 
-    outbound_date: str, 
-    return_date: Optional[str] = None
-) -> List[Dict[str, str]]:
+    origin: str,
+    destination: str,
+    outbound_date: str,
+    return_date: Optional[str] = None,
+    max_results: int = 10,
+    max_stops: Optional[int] = None
+) -> List["FlightRecord"]:
     """
     Search for flights using SerpAPI Google Flights.
-    
+
     Args:
         origin: Departure airport code (e.g., 'ATL', 'JFK')
-        destination: Arrival airport code (e.g., 'LAX', 'ORD') 
+        destination: Arrival airport code (e.g., 'LAX', 'ORD')
         outbound_date: Departure date in YYYY-MM-DD format
         return_date: Return date for round trips in YYYY-MM-DD format (optional)
-        
+        max_results: Keep only the cheapest max_results flights
+        max_stops: Drop flights with more than max_stops stops (None keeps all)
+
     Returns:
-        List of flight dictionaries containing:
+        List of FlightRecord instances with:
         - airline: Airline name
         - price: Flight price
         - duration: Total flight duration
@@ -39,13 +52,14 @@ def search_flights(
         - arrival: Arrival airport and time
         - travel_class: Travel class
         - airline_logo: Airline logo URL (if available)
+        - price_num: Numeric price for sorting/comparison
         
     Raises:
         ValueError: If SERP_API_KEY is not found in environment variables
         Exception: If SerpAPI request fails
     """
     # Validate API key
-    api_key = os.getenv("SERP_API_KEY")
+    api_key = _SERP_API_KEY
     if not api_key:
         raise ValueError(
             "SERP_API_KEY not found in environment variables. "
@@ -74,47 +88,81 @@ def search_flights(
         print(f"Searching flights: {origin} → {destination}")
         print(f"Outbound: {outbound_date}" + (f", Return: {return_date}" if return_date else ""))
         
-        # Execute search
-        search = GoogleSearch(search_params)
-        results = search.get_dict()
+        # Execute search on the shared session (the serpapi wrapper would
+        # build a fresh connection per call)
+        response = _SERP_SESSION.get(_SERP_ENDPOINT, params=search_params, timeout=30)
+        results = response.json()
         
         # Check for API errors
         if "error" in results:
             raise Exception(f"SerpAPI error: {results['error']}")
         
         # Process and return formatted results
-        return _format_flight_data(results)
+        return _format_flight_data(results, top_k=max_results, max_stops=max_stops)
         
     except Exception as e:
         print(f"Flight search failed: {str(e)}")
         raise
 
 
-def _format_flight_data(raw_results: Dict[str, Any]) -> List[Dict[str, str]]:
+@dataclass(slots=True)
+class FlightRecord:
+    """Slotted flight record; roughly half the memory of the equivalent dict.
+
+    price_num is the price parsed once to a float (inf when unparseable) so
+    numeric comparisons never re-parse the string.
+    """
+    airline: str
+    price: str
+    duration: str
+    stops: str
+    departure: str
+    arrival: str
+    travel_class: str
+    airline_logo: str
+    price_num: float
+
+
+def _price_number(price: Any) -> float:
+    """Parse a price like '$1,234' to a float; inf when unparseable."""
+    try:
+        return float(str(price).replace('$', '').replace(',', ''))
+    except (ValueError, TypeError):
+        return float("inf")
+
+
+def _format_flight_data(raw_results: Dict[str, Any], top_k: int = 8, max_stops: Optional[int] = None) -> List[FlightRecord]:
     """
     Format raw SerpAPI results into standardized flight data.
-    
+
     Args:
         raw_results: Raw search results from SerpAPI
-        
+        top_k: Keep only the top_k cheapest flights (None keeps all)
+        max_stops: Drop flights with more than max_stops stops (None keeps all)
+
     Returns:
-        List of formatted flight dictionaries
+        List of formatted FlightRecord instances
     """
     best_flights = raw_results.get("best_flights", [])
-    
+
     if not best_flights:
         print("No flights found in search results")
         return []
-    
+
+    # Filter and truncate to the cheapest top_k before formatting, so the
+    # dict-get chains and f-strings below only run for flights we keep
+    best_flights = [
+        flight for flight in best_flights
+        if flight.get("flights") and (max_stops is None or len(flight["flights"]) - 1 <= max_stops)
+    ]
+    if top_k is not None and len(best_flights) > top_k:
+        best_flights = sorted(best_flights, key=lambda f: f.get("price", float("inf")))[:top_k]
+
     print(f"Processing {len(best_flights)} flights...")
-    
+
     formatted_flights = []
-    
+
     for flight in best_flights:
-        # Skip flights without flight segments
-        if not flight.get("flights") or len(flight["flights"]) == 0:
-            continue
-        
         # Get primary flight segment (first leg)
         primary_segment = flight["flights"][0]
         
@@ -139,17 +187,19 @@ def _format_flight_data(raw_results: Dict[str, Any]) -> List[Dict[str, str]]:
         stops = "Nonstop" if num_segments == 1 else f"{num_segments - 1} stop(s)"
         
         # Build flight record
-        flight_record = {
-            "airline": primary_segment.get("airline", "Unknown Airline"),
-            "price": str(flight.get("price", "N/A")),
-            "duration": duration_str,
-            "stops": stops,
-            "departure": departure_info,
-            "arrival": arrival_info,
-            "travel_class": primary_segment.get("travel_class", "Economy"),
-            "airline_logo": primary_segment.get("airline_logo", "")
-        }
-        
+        price = flight.get("price", "N/A")
+        flight_record = FlightRecord(
+            airline=primary_segment.get("airline", "Unknown Airline"),
+            price=str(price),
+            duration=duration_str,
+            stops=stops,
+            departure=departure_info,
+            arrival=arrival_info,
+            travel_class=primary_segment.get("travel_class", "Economy"),
+            airline_logo=primary_segment.get("airline_logo", ""),
+            price_num=_price_number(price)
+        )
+
         formatted_flights.append(flight_record)
     
     return formatted_flights
@@ -176,66 +226,56 @@ def _extract_airport_info(airport_data: Dict[str, Any], info_type: str) -> str:
     return f"{airport_name} ({airport_code}) at {flight_time}"
 
 
-def display_flights(flights: List[Dict[str, str]], limit: Optional[int] = None) -> None:
+def display_flights(flights: List[FlightRecord], limit: Optional[int] = None) -> None:
     """
     Display flight results in a formatted table.
-    
+
     Args:
-        flights: List of flight dictionaries
+        flights: List of flight records
         limit: Maximum number of flights to display (optional)
     """
     if not flights:
         return ["No flights found."]
 
     display_count = len(flights) if limit is None else min(limit, len(flights))
-    result = []
-    result.append(f"\n{'='*80}")
-    result.append(f"FLIGHT SEARCH RESULTS (Showing {display_count} of {len(flights)} flights)")
-    result.append(f"{'='*80}")
-
-    for i, flight in enumerate(flights[:display_count], 1):
-        flight_str = [
-            f"\n✈️  Flight Option {i}:",
-            f"   🏢 Airline: {flight['airline']}",
-            f"   💰 Price: {flight['price']}$",
-            f"   ⏱️  Duration: {flight['duration']}",
-            f"   🛑 Stops: {flight['stops']}",
-            f"   🛫 Departure: {flight['departure']}",
-            f"   🛬 Arrival: {flight['arrival']}",
-            f"   🎫 Class: {flight['travel_class']}"
-        ]
-        result.extend(flight_str)
-    return result
-
-
-def get_cheapest_flight(flights: List[Dict[str, str]]) -> Optional[Dict[str, str]]:
+    header = [
+        f"\n{'='*80}",
+        f"FLIGHT SEARCH RESULTS (Showing {display_count} of {len(flights)} flights)",
+        f"{'='*80}"
+    ]
+    # One f-string per flight instead of eight small appends
+    body = [
+        f"\n✈️  Flight Option {i}:\n"
+        f"   🏢 Airline: {flight.airline}\n"
+        f"   💰 Price: {flight.price}$\n"
+        f"   ⏱️  Duration: {flight.duration}\n"
+        f"   🛑 Stops: {flight.stops}\n"
+        f"   🛫 Departure: {flight.departure}\n"
+        f"   🛬 Arrival: {flight.arrival}\n"
+        f"   🎫 Class: {flight.travel_class}"
+        for i, flight in enumerate(flights[:display_count], 1)
+    ]
+    return header + body
+
+
+def get_cheapest_flight(flights: List[FlightRecord]) -> Optional[FlightRecord]:
     """
     Find the cheapest flight from search results.
-    
+
     Args:
-        flights: List of flight dictionaries
-        
+        flights: List of flight records
+
     Returns:
-        Cheapest flight dictionary or None if no flights
+        Cheapest flight record or None if no flights
     """
-    if not flights:
-        return None
-    
-    # Filter out flights with non-numeric prices
-    valid_flights = []
-    for flight in flights:
-        try:
-            price_str = flight['price'].replace('$', '').replace(',', '')
-            float(price_str)  # Test if convertible to number
-            valid_flights.append(flight)
-        except (ValueError, AttributeError):
-            continue
-    
-    if not valid_flights:
+    # Prices were parsed once at formatting time; unparseable prices are inf
+    priced_flights = [flight for flight in flights if flight.price_num != float("inf")]
+
+    if not priced_flights:
         return None
-    
+
     # Find flight with minimum price
-    return min(valid_flights, key=lambda f: float(f['price'].replace('$', '').replace(',', '')))
+    return min(priced_flights, key=lambda flight: flight.price_num)
 
 
 # Example usage and testing
@@ -258,7 +298,7 @@ if __name__ == "__main__":
         # Find cheapest option
         cheapest = get_cheapest_flight(flights)
         if cheapest:
-            print(f"\n🏆 Cheapest Option: {cheapest['airline']} - {cheapest['price']}")
+            print(f"\n🏆 Cheapest Option: {cheapest.airline} - {cheapest.price}")
             
     except Exception as e:
         print(f"Example 1 failed: {e}")
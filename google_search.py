@@ -1,13 +1,19 @@
 import os
-import requests
+import httpx
+
+# Shared async client; keep-alive plus HTTP/2 multiplexing lets concurrent
+# searches reuse a single connection to the search endpoint
+_CLIENT = httpx.AsyncClient(http2=True, timeout=10.0)
+
 class GoogleSearch:
-    def __init__(self):
+    def __init__(self, client=None):
         self.google_search_api_key = os.getenv("GOOGLE_SEARCH_API")
         self.google_search_engine_ID = os.getenv("GOOGLE_SEARCH_ENGINE_ID")
         self.google_search_api_endpoint = os.getenv("GOOGLE_API_ENDPOINT")
-        self.query_result = None
+        self._client = client or _CLIENT
+        self._links = []
 
-    def search(self, query):
+    async def search(self, query):
         # print("GOOGLE SEARCH")
         params = {
             "key": self.google_search_api_key,
@@ -16,30 +22,26 @@ class GoogleSearch:
         }
         try:
             # print("Searching in Google...")
-            response = requests.get(self.google_search_api_endpoint, params=params)
+            response = await self._client.get(self.google_search_api_endpoint, params=params)
             # response.raise_for_status()
-            self.query_result = response.json()
+            # Keep just the result links instead of the full response payload
+            self._links = [item['link'] for item in response.json().get('items', [])]
         except Exception as error:
             return error
 
     def get_first_link(self):
-        item = ""
         try:
-            if 'items' in self.query_result:
-                item = self.query_result['items'][0]['link']
-            return item
+            return self._links[0] if self._links else ""
         except Exception as error:
             print(error)
             return ""
-    
+
     def get_first_non_pdf_link(self):
-        item = ""
         try:
-            if 'items' in self.query_result:
-                for item in self.query_result['items']:
-                    if not item['link'].endswith(".pdf"):
-                        return item["link"]
-            return item
+            for link in self._links:
+                if not link.endswith(".pdf"):
+                    return link
+            return ""
         except Exception as error:
             print(error)
             return ""
\ No newline at end of file
@@ -6,13 +6,30 @@ It can be used independently without any server infrastructure.
 """
 
 import os
+import orjson
+import logging
+import requests
 from typing import Dict, Any, List, Optional
-from serpapi import GoogleSearch
+from cachetools import TTLCache
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Logger instead of print on the search path: lazy %-formatting skips the
+# string build when the level is off, and there is no stdout lock contention
+# under concurrent searches; display_hotels keeps print for CLI output
+logger = logging.getLogger(__name__)
+
+# Shared keep-alive session to serpapi.com; orjson parses the multi-hundred-KB
+# responses faster than the wrapper's stdlib json
+_SERP_SESSION = requests.Session()
+_SERP_ENDPOINT = "https://serpapi.com/search.json"
+
+# Successful searches are cached for 10 minutes; identical queries skip the
+# SerpAPI round-trip (and its quota cost) entirely
+_HOTEL_CACHE = TTLCache(maxsize=512, ttl=600)
+
 
 def search_hotels(
     location: str,
@@ -72,7 +89,17 @@ def search_hotels(
             "SERP_API_KEY not found in environment variables. "
             "Please set it in your .env file or environment."
         )
-    
+
+    # Serve repeat searches from the TTL cache
+    cache_key = (
+        location.strip().lower(), check_in_date, check_out_date, adults, children,
+        children_ages, sort_by, min_price, max_price, hotel_class, rating, vacation_rentals
+    )
+    cached = _HOTEL_CACHE.get(cache_key)
+    if cached is not None:
+        logger.info("Using cached hotel results for: %s", location)
+        return cached
+
     # Prepare search parameters
     search_params = {
         "api_key": api_key,
@@ -110,23 +137,25 @@ def search_hotels(
         search_params["vacation_rentals"] = True
     
     try:
-        print(f"Searching hotels in: {location}")
-        print(f"Check-in: {check_in_date}, Check-out: {check_out_date}")
-        print(f"Guests: {adults} adults" + (f", {children} children" if children > 0 else ""))
+        logger.info("Searching hotels in: %s", location)
+        logger.info("Check-in: %s, Check-out: %s", check_in_date, check_out_date)
+        logger.info("Guests: %s adults, %s children", adults, children)
         
-        # Execute search
-        search = GoogleSearch(search_params)
-        results = search.get_dict()
+        # Execute search on the shared session
+        response = _SERP_SESSION.get(_SERP_ENDPOINT, params=search_params, timeout=30)
+        results = orjson.loads(response.content)
         
         # Check for API errors
         if "error" in results:
             raise Exception(f"SerpAPI error: {results['error']}")
         
-        # Process and return formatted results
-        return _format_hotel_data(results)
-        
+        # Process, cache and return formatted results; failures are not cached
+        hotels = _format_hotel_data(results)
+        _HOTEL_CACHE[cache_key] = hotels
+        return hotels
+
     except Exception as e:
-        print(f"Hotel search failed: {str(e)}")
+        logger.error("Hotel search failed: %s", e)
         raise
 
 
@@ -147,66 +176,87 @@ def _format_hotel_data(raw_results: Dict[str, Any]) -> List[Dict[str, Any]]:
     all_hotels = properties + ads
     
     if not all_hotels:
-        print("No hotels found in search results")
+        logger.info("No hotels found in search results")
         return []
-    
-    print(f"Processing {len(all_hotels)} hotels ({len(properties)} properties + {len(ads)} ads)...")
-    
+
+    logger.info("Processing %d hotels (%d properties + %d ads)...", len(all_hotels), len(properties), len(ads))
+
     formatted_hotels = []
-    
+
+    # Bind the method once; the interpreter re-resolves hotel.get per call
+    _get = dict.get
+
     for hotel in all_hotels:
         # Skip hotels without basic information
-        if not hotel.get("name"):
+        if not _get(hotel, "name"):
             continue
-        
+
         # Extract pricing information
         price_info = _extract_price_info(hotel)
-        
+
         # Extract location information
-        gps_coords = hotel.get("gps_coordinates", {})
+        gps_coords = _get(hotel, "gps_coordinates", {})
         location_str = f"Lat: {gps_coords.get('latitude', 'N/A')}, Lon: {gps_coords.get('longitude', 'N/A')}"
-        
+
         # Extract amenities
-        amenities = hotel.get("amenities", [])
-        if isinstance(amenities, list):
+        amenities = _get(hotel, "amenities", [])
+        if type(amenities) is list:
             amenities_str = ", ".join(amenities[:5])  # Limit to first 5 amenities
             if len(amenities) > 5:
                 amenities_str += f" (and {len(amenities) - 5} more)"
         else:
             amenities_str = "N/A"
-        
+
         # Extract images
-        images = hotel.get("images", [])
+        images = _get(hotel, "images", [])
         image_urls = []
         if images:
             for img in images[:3]:  # Get first 3 images
                 if isinstance(img, dict):
                     image_urls.append(img.get("original_image", img.get("thumbnail", "")))
-        
+
+        # Single lookup for the description instead of two
+        desc = _get(hotel, "description", "")
+        description = desc[:200] + "..." if desc else "N/A"
+
         # Build hotel record
         hotel_record = {
-            "name": hotel.get("name", "Unknown Hotel"),
-            "type": hotel.get("type", "hotel"),
+            "name": _get(hotel, "name", "Unknown Hotel"),
+            "type": _get(hotel, "type", "hotel"),
             "price_per_night": price_info["per_night"],
             "total_price": price_info["total"],
-            "rating": hotel.get("overall_rating", "N/A"),
-            "reviews": hotel.get("reviews", 0),
+            "rating": _get(hotel, "overall_rating", "N/A"),
+            "reviews": _get(hotel, "reviews", 0),
             "hotel_class": _format_hotel_class(hotel),
             "location": location_str,
             "amenities": amenities_str,
             "images": image_urls,
-            "check_in_time": hotel.get("check_in_time", "N/A"),
-            "check_out_time": hotel.get("check_out_time", "N/A"),
-            "property_token": hotel.get("property_token", ""),
-            "link": hotel.get("link", ""),
-            "description": hotel.get("description", "")[:200] + "..." if hotel.get("description", "") else "N/A"
+            "check_in_time": _get(hotel, "check_in_time", "N/A"),
+            "check_out_time": _get(hotel, "check_out_time", "N/A"),
+            "property_token": _get(hotel, "property_token", ""),
+            "link": _get(hotel, "link", ""),
+            "description": description
         }
-        
+
+        # Parse price and rating once so selection helpers compare floats
+        hotel_record["_price_num"] = _parse_number(price_info["per_night"])
+        hotel_record["_rating_num"] = _parse_number(_get(hotel, "overall_rating"))
+
         formatted_hotels.append(hotel_record)
     
     return formatted_hotels
 
 
+def _parse_number(value: Any) -> Optional[float]:
+    """
+    Parse a price/rating like '$1,234' or 4.5 to a float; None when unparseable.
+    """
+    try:
+        return float(str(value).replace('$', '').replace(',', ''))
+    except (ValueError, TypeError):
+        return None
+
+
 def _extract_price_info(hotel_data: Dict[str, Any]) -> Dict[str, str]:
     """
     Extract and format price information from hotel data.
@@ -317,24 +367,12 @@ def get_cheapest_hotel(hotels: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]
     Returns:
         Cheapest hotel dictionary or None if no hotels
     """
-    if not hotels:
-        return None
-    
-    # Filter out hotels with non-numeric prices
-    valid_hotels = []
-    for hotel in hotels:
-        try:
-            price_str = hotel['price_per_night'].replace('$', '').replace(',', '')
-            float(price_str)  # Test if convertible to number
-            valid_hotels.append(hotel)
-        except (ValueError, AttributeError):
-            continue
-    
-    if not valid_hotels:
-        return None
-    
-    # Find hotel with minimum price
-    return min(valid_hotels, key=lambda h: float(h['price_per_night'].replace('$', '').replace(',', '')))
+    # Prices were parsed once at formatting time; single pass, no re-parsing
+    return min(
+        (hotel for hotel in hotels if hotel.get("_price_num") is not None),
+        key=lambda h: h["_price_num"],
+        default=None
+    )
 
 
 def get_highest_rated_hotel(hotels: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
@@ -347,25 +385,12 @@ def get_highest_rated_hotel(hotels: List[Dict[str, Any]]) -> Optional[Dict[str,
     Returns:
         Highest rated hotel dictionary or None if no hotels
     """
-    if not hotels:
-        return None
-    
-    # Filter out hotels with non-numeric ratings
-    valid_hotels = []
-    for hotel in hotels:
-        try:
-            rating = hotel['rating']
-            if rating != "N/A":
-                float(rating)  # Test if convertible to number
-                valid_hotels.append(hotel)
-        except (ValueError, TypeError):
-            continue
-    
-    if not valid_hotels:
-        return None
-    
-    # Find hotel with maximum rating
-    return max(valid_hotels, key=lambda h: float(h['rating']))
+    # Ratings were parsed once at formatting time; single pass, no re-parsing
+    return max(
+        (hotel for hotel in hotels if hotel.get("_rating_num") is not None),
+        key=lambda h: h["_rating_num"],
+        default=None
+    )
 
 
 # Example usage and testing
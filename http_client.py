@@ -0,0 +1,17 @@
+"""
+Shared HTTP client for synchronous outbound requests.
+
+One keep-alive HTTP/2 client means repeat calls to the same host
+(weatherapi.com, scraped sites, ...) reuse a connection instead of paying a
+TLS handshake each time.
+"""
+
+import httpx
+
+CLIENT = httpx.Client(
+    http2=True,
+    timeout=10,
+    headers={"Accept-Encoding": "gzip, deflate, br"},
+    limits=httpx.Limits(max_keepalive_connections=20),
+    follow_redirects=True
+)
@@ -1,37 +1,75 @@
 import os
+import time
+import random
+import asyncio
+import threading
 from datetime import datetime
 from langchain_openai import AzureChatOpenAI
 from azure.identity import ClientSecretCredential
+from azure.core.exceptions import ClientAuthenticationError
+from openai import AuthenticationError, BadRequestError, NotFoundError, PermissionDeniedError
 from dotenv import load_dotenv
 load_dotenv()
 
+def _backoff_delay(retries):
+    """Exponential backoff with jitter, capped at 30s; hammering a throttled
+    endpoint immediately only slows recovery"""
+    return min(30, 2 ** retries + random.uniform(0, 0.5))
+
+# Errors that fail identically on retry (bad credentials, malformed request,
+# unknown deployment); backing off on these only delays surfacing the problem
+_NON_RETRYABLE = (AuthenticationError, PermissionDeniedError, BadRequestError, NotFoundError)
+
 class LLM:
     _access_token = None
     _expires_on = None
     _instance = None
+    # One refresh per expiry window even under concurrent callers
+    _token_lock = threading.Lock()
+    # Reused so the Azure SDK keeps its internal MSAL cache across refreshes
+    _credential = None
+    # (base, deployment, version) -> (token, client); constructing an
+    # AzureChatOpenAI sets up an HTTPS pool, so reuse it across instances
+    _client_cache = {}
     def __init__(self, base, deployment, version, callback = None, name = None):
         if not LLM._access_token or self.is_token_expired():
             self.update_access_token()
-        os.environ["AZURE_OPENAI_API_KEY"] = LLM._access_token
-        os.environ["AZURE_OPENAI_ENDPOINT"] = base
         self._name = name
+        self._base = base
+        self._deployment = deployment
+        self._version = version
+        self._callback = callback
+        self.client = self._get_client()
+
+    def _get_client(self):
+        """Reuse the cached client for this endpoint; rebuild only when the
+        access token has rotated since it was created"""
+        key = (self._base, self._deployment, self._version)
+        token, client = LLM._client_cache.get(key, (None, None))
+        if client is not None and token == LLM._access_token:
+            return client
         retries = 0
         max_retries = 5
         err = True
         while err and retries < max_retries:
             try:
-                self.client = AzureChatOpenAI(
+                # Credentials are passed directly instead of mutated into
+                # os.environ, which raced under concurrent construction
+                client = AzureChatOpenAI(
                     name=self._name,
-                    azure_deployment=deployment,
-                    openai_api_version=version,
-                    callbacks=callback
+                    api_key=LLM._access_token,
+                    azure_endpoint=self._base,
+                    azure_deployment=self._deployment,
+                    openai_api_version=self._version,
+                    callbacks=self._callback
                 )
-                self.conversation = []
                 err = False
             except Exception as e:
                 print(f"Error initializing Azure client: {e}")
                 retries += 1
-        
+        LLM._client_cache[key] = (LLM._access_token, client)
+        return client
+
     @classmethod
     def is_token_expired(cls):
         if not cls._expires_on:
@@ -40,32 +78,38 @@ class LLM:
     
     @classmethod
     def get_access_token(cls):
-        client_id = os.getenv("client_id")
-        tenant_id = os.getenv("tenant_id")
-        client_secret = os.getenv("client_secret")
-
-        credential = ClientSecretCredential(
-            tenant_id=tenant_id,
-            client_id=client_id,
-            client_secret=client_secret
-        )
-        access_token = credential.get_token("https://cognitiveservices.azure.com/.default")
+        if cls._credential is None:
+            cls._credential = ClientSecretCredential(
+                tenant_id=os.getenv("tenant_id"),
+                client_id=os.getenv("client_id"),
+                client_secret=os.getenv("client_secret")
+            )
+        access_token = cls._credential.get_token("https://cognitiveservices.azure.com/.default")
         return access_token
-    
+
     @classmethod
     def update_access_token(cls):
-        retries = 0
-        max_retries = 5
-        err = True
-        while err and retries < max_retries:
-            try:
-                access_token = cls.get_access_token()
-                err = False
-            except:
-                print("Error getting access token, retrying...")
-                retries += 1
-        cls._access_token = access_token.token
-        cls._expires_on = str(access_token.expires_on - 300)
+        with cls._token_lock:
+            # Double-checked: another thread may have refreshed while we waited
+            if cls._access_token and not cls.is_token_expired():
+                return
+            retries = 0
+            max_retries = 5
+            err = True
+            while err and retries < max_retries:
+                try:
+                    access_token = cls.get_access_token()
+                    err = False
+                except ClientAuthenticationError:
+                    # Bad credentials won't get better with retries
+                    raise
+                except Exception:
+                    print("Error getting access token, retrying...")
+                    retries += 1
+                    if retries < max_retries:
+                        time.sleep(_backoff_delay(retries))
+            cls._access_token = access_token.token
+            cls._expires_on = str(access_token.expires_on - 300)
     # def __new__(cls):
     #     if cls._instance is None:
     #         cls._instance = super().__new__(cls)
@@ -109,7 +153,7 @@ class LLM:
     #     access_token = credential.get_token("https://cognitiveservices.azure.com/.default")
     #     return access_token
     
-    def inference(self, prompt) -> str:
+    def inference(self, prompt, response_format = None) -> str:
         err = True
         max_retries = 5
         retries = 0
@@ -127,14 +171,87 @@ class LLM:
                     print("Generating new Access Token")
                     print("***************************")
                     self.update_access_token()
+                    self.client = self._get_client()
                 if isinstance(prompt, str):
                     prompt = prompt.strip()
-                response = self.client.invoke(prompt, timeout = 150)
-                self.conversation.append({"role": "user", "content": prompt})
-                self.conversation.append({"role": "agent", "content": response.content})
+                # Ask the API for guaranteed JSON when a response format is requested
+                client = self.client if response_format is None else self.client.bind(response_format=response_format)
+                response = client.invoke(prompt, timeout = 150)
+                err = False
+            except _NON_RETRYABLE:
+                raise
+            except Exception as e:
+                print(f"Error: {e}")
+                retries += 1
+                if retries < max_retries:
+                    print("Retrying...")
+                    time.sleep(_backoff_delay(retries))
+        return response.content
+
+    async def ainference(self, prompt, response_format = None) -> str:
+        """Async counterpart of inference; lets independent prompts overlap"""
+        err = True
+        max_retries = 5
+        retries = 0
+        while err and retries < max_retries:
+            try:
+                if self.is_token_expired():
+                    print("***************************")
+                    print("Generating new Access Token")
+                    print("***************************")
+                    self.update_access_token()
+                    self.client = self._get_client()
+                if isinstance(prompt, str):
+                    prompt = prompt.strip()
+                # Ask the API for guaranteed JSON when a response format is requested
+                client = self.client if response_format is None else self.client.bind(response_format=response_format)
+                response = await client.ainvoke(prompt, timeout = 150)
+                err = False
+            except _NON_RETRYABLE:
+                raise
+            except Exception as e:
+                print(f"Error: {e}")
+                retries += 1
+                if retries < max_retries:
+                    print("Retrying...")
+                    await asyncio.sleep(_backoff_delay(retries))
+        return response.content
+
+    async def ainference_many(self, prompts):
+        """Run independent prompts concurrently and return their responses in order"""
+        return await asyncio.gather(*[self.ainference(prompt) for prompt in prompts])
+
+    def inference_stream(self, prompt):
+        """Stream a completion, yielding content chunks as they arrive"""
+        if isinstance(prompt, str):
+            prompt = prompt.strip()
+        err = True
+        max_retries = 5
+        retries = 0
+        while err and retries < max_retries:
+            try:
+                if self.is_token_expired():
+                    print("***************************")
+                    print("Generating new Access Token")
+                    print("***************************")
+                    self.update_access_token()
+                    self.client = self._get_client()
+                stream = self.client.stream(prompt, timeout = 150)
+                # Pull the first chunk inside the loop so connection and
+                # rate-limit errors get the same backoff as inference; nothing
+                # has been yielded yet, so retrying is safe
+                first_chunk = next(stream, None)
                 err = False
+            except _NON_RETRYABLE:
+                raise
             except Exception as e:
                 print(f"Error: {e}")
-                print("Retrying...")
                 retries += 1
-        return response.content
\ No newline at end of file
+                if retries < max_retries:
+                    print("Retrying...")
+                    time.sleep(_backoff_delay(retries))
+        if first_chunk is not None and first_chunk.content:
+            yield first_chunk.content
+        for chunk in stream:
+            if chunk.content:
+                yield chunk.content
\ No newline at end of file
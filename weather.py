@@ -2,21 +2,22 @@ import os
 from dotenv import load_dotenv
 load_dotenv()
 from datetime import datetime
-import json
+import orjson
+import functools
 from llm import LLM
-llm = LLM(os.getenv("api_base"), os.getenv("deployment_name"), os.getenv("api_version"))
-def get_llm_suggestions(budget: float, start_date: str, end_date: str):
-    """
-    Get destination suggestions from OpenAI's GPT based on budget and dates.
-    Returns only destination names and countries.
-    """
-    # Calculate trip duration
-    start = datetime.strptime(start_date, "%Y-%m-%d")
-    end = datetime.strptime(end_date, "%Y-%m-%d")
-    duration = (end - start).days + 1
+# Constructed lazily: building the LLM at import forced an Azure token fetch
+# before any user code ran
+_llm = None
 
-    # Construct the prompt
-    prompt = f"""Given the following travel parameters:
+def _get_llm():
+    global _llm
+    if _llm is None:
+        _llm = LLM(os.getenv("api_base"), os.getenv("deployment_name"), os.getenv("api_version"))
+    return _llm
+
+# Prompt templates built once at module scope; a stable prefix also improves
+# the odds of prompt-cache hits on the LLM side
+_SUGGEST_PROMPT = """Given the following travel parameters:
     - Total Budget: ₹{budget}
     - Start Date: {start_date}
     - End Date: {end_date}
@@ -37,9 +38,70 @@ def get_llm_suggestions(budget: float, start_date: str, end_date: str):
     ```
     Only return the JSON array, no other text."""
 
-    resp = llm.inference(prompt)
+_WEATHER_ANALYSIS_PROMPT = """Based on the weather forecasts for different destinations:
+
+{weather_summary}
+
+Travel Dates: {start_date} to {end_date}
+
+Analyze the weather conditions and recommend the best destination to visit during these dates.
+Consider factors like temperature, rain probability, and overall conditions.
+Return the suggestions in order of preference (best first).
+
+Return the response in this exact JSON format:
+{{
+    "ranked": [
+        {{"destination": "City Name", "country": "Country Name"}}
+    ]
+}}
+
+Order the destinations from best to worst weather conditions.
+Only return the JSON object, no other text."""
+
+def _extract_json_array(text: str) -> str:
+    """
+    Return the first balanced [...] block from an LLM response.
+    A depth-counting scan handles nested arrays that find("]") truncated.
+    """
+    start = text.find('[')
+    if start == -1:
+        return ""
+    depth = 0
+    for i in range(start, len(text)):
+        if text[i] == '[':
+            depth += 1
+        elif text[i] == ']':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return text[start:]
+
+def get_llm_suggestions(budget: float, start_date: str, end_date: str):
+    """
+    Get destination suggestions from OpenAI's GPT based on budget and dates.
+    Returns only destination names and countries.
+    """
+    # Round the budget to the nearest ₹1000 so near-identical requests share a
+    # cache entry; the date in the key keeps suggestions fresh day to day
+    try:
+        budget_key = round(float(budget) / 1000) * 1000
+    except (TypeError, ValueError):
+        budget_key = budget
+    return _cached_llm_suggestions(budget_key, start_date, end_date, datetime.now().date().isoformat())
+
+@functools.lru_cache(maxsize=256)
+def _cached_llm_suggestions(budget, start_date: str, end_date: str, day: str):
+    # Calculate trip duration
+    start = datetime.strptime(start_date, "%Y-%m-%d")
+    end = datetime.strptime(end_date, "%Y-%m-%d")
+    duration = (end - start).days + 1
+
+    # Construct the prompt
+    prompt = _SUGGEST_PROMPT.format(budget=budget, start_date=start_date, end_date=end_date, duration=duration)
+
+    resp = _get_llm().inference(prompt)
     # Parse the response
-    suggestions = json.loads(resp[resp.find("["):resp.find("]")+1])
+    suggestions = orjson.loads(_extract_json_array(resp))
     return suggestions
 
 def check_date_within_forecast_range(start_date: str, max_days: int = 14) -> bool:
@@ -51,12 +113,95 @@ def check_date_within_forecast_range(start_date: str, max_days: int = 14) -> boo
     days_difference = (start - today).days
     return 0 <= days_difference <= max_days
 
-import requests
+import asyncio
+import httpx
+from http_client import CLIENT as _HTTP
 from typing import Dict
+
+_FORECAST_URL = "https://api.weatherapi.com/v1/forecast.json"
+
+def _forecast_days_needed(end_date: str, max_days: int = 14) -> int:
+    """
+    Days of forecast needed to cover today through end_date, capped at the
+    API maximum; a 2-day trip then transfers and parses a 2-day payload
+    instead of the full 14 days.
+    """
+    remaining = (datetime.strptime(end_date, "%Y-%m-%d").date() - datetime.now().date()).days + 1
+    return min(max_days, max(1, remaining))
+
+def _parse_forecast_days(data: Dict, start_date: str, end_date: str) -> list:
+    """
+    Pull the requested date window out of a WeatherAPI forecast response.
+    """
+    forecasts = []
+    for day in data.get("forecast", {}).get("forecastday", []):
+        if day["date"] > end_date:
+            break
+        if day["date"] >= start_date:
+            forecasts.append({
+                "date": day["date"],
+                "temp_max": day["day"]["maxtemp_c"],
+                "temp_min": day["day"]["mintemp_c"],
+                "conditions": day["day"]["condition"]["text"],
+                "humidity": day["day"]["avghumidity"],
+                "rain_chance": day["day"]["daily_chance_of_rain"]
+            })
+    return forecasts
+
+async def _fetch_forecast_async(client, place: str, start_date: str, end_date: str, api_key: str) -> Dict:
+    """
+    Async mirror of get_weather_forecast sharing one pooled client.
+    The caller is expected to have checked the forecast range already.
+    """
+    params = {
+        "key": api_key,
+        "q": place,
+        "days": _forecast_days_needed(end_date)
+    }
+    try:
+        response = await client.get(_FORECAST_URL, params=params, timeout=10)
+        response.raise_for_status()
+        return {
+            "status": "success",
+            "data": _parse_forecast_days(orjson.loads(response.content), start_date, end_date)
+        }
+    except httpx.HTTPError as e:
+        return {
+            "status": "error",
+            "message": f"Weather API error: {str(e)}"
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Unexpected error: {str(e)}"
+        }
+
+def _fetch_forecasts_bulk(locations, start_date: str, end_date: str, api_key: str) -> Dict:
+    """
+    Fetch forecasts for several locations with one WeatherAPI bulk call
+    instead of one round-trip per location.
+    """
+    params = {
+        "key": api_key,
+        "q": "bulk",
+        "days": _forecast_days_needed(end_date)
+    }
+    body = {"locations": [{"q": location, "custom_id": str(i)} for i, location in enumerate(locations)]}
+    response = _HTTP.post(_FORECAST_URL, params=params, json=body)
+    response.raise_for_status()
+
+    weather_data = {}
+    for entry in orjson.loads(response.content).get("bulk", []):
+        query = entry.get("query", {})
+        index = int(query.get("custom_id", -1))
+        if 0 <= index < len(locations):
+            weather_data[locations[index]] = _parse_forecast_days(query, start_date, end_date)
+    return weather_data
+
 def get_weather_forecast(place: str, start_date: str, end_date: str, api_key: str) -> Dict:
     """
     Fetch daily weather forecast for a given place starting from start_date.
-    Always fetches 14 days of forecast if available.
+    Fetches only as many days as the trip window needs (up to 14).
     Returns status to indicate if date is within forecast range or needs LLM response.
     """
     # First check if the date is within forecast range
@@ -66,41 +211,22 @@ def get_weather_forecast(place: str, start_date: str, end_date: str, api_key: st
             "message": "Date is beyond 14-day forecast range, use LLM suggestion"
         }
     
-    url = f"https://api.weatherapi.com/v1/forecast.json"
-    
     params = {
         "key": api_key,
         "q": place,
-        "days": 14  # Always fetch max available forecast
+        "days": _forecast_days_needed(end_date)
     }
-    
+
     try:
-        response = requests.get(url, params=params)
+        response = _HTTP.get(_FORECAST_URL, params=params)
         response.raise_for_status()
-        
-        data = response.json()
-        forecasts = []
-
-        for day in data.get("forecast", {}).get("forecastday", []):
-            if day["date"] > end_date:
-                return {
-                    "status": "success",
-                    "data": forecasts
-                }
-            if day["date"] >= start_date:
-                forecasts.append({
-                    "date": day["date"],
-                    "temp_max": day["day"]["maxtemp_c"],
-                    "temp_min": day["day"]["mintemp_c"],
-                    "conditions": day["day"]["condition"]["text"],
-                    "humidity": day["day"]["avghumidity"],
-                    "rain_chance": day["day"]["daily_chance_of_rain"]
-                })
+
+        # orjson parses the nested forecast payload faster than response.json()
         return {
             "status": "success",
-            "data": forecasts
+            "data": _parse_forecast_days(orjson.loads(response.content), start_date, end_date)
         }
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         return {
             "status": "error",
             "message": f"Weather API error: {str(e)}"
@@ -127,14 +253,28 @@ def get_travel_destination(start_date: str, end_date: str, budget: float, api_ke
         # If beyond 14 days, return suggestions as is
         return suggested_places
     
-    # For dates within 14 days, get weather for each place
-    weather_data = {}
-    for place in suggested_places:
-        location = f"{place['destination']}, {place['country']}"
-        weather_result = get_weather_forecast(location, start_date, end_date, api_key)
-        
-        if weather_result["status"] == "success":
-            weather_data[location] = weather_result["data"]
+    # For dates within 14 days, fetch all forecasts in one bulk API call,
+    # falling back to concurrent per-destination fetches if bulk fails
+    locations = [f"{place['destination']}, {place['country']}" for place in suggested_places]
+
+    try:
+        weather_data = _fetch_forecasts_bulk(locations, start_date, end_date, api_key)
+    except Exception as e:
+        print(f"Bulk forecast failed, fetching per destination: {e}")
+
+        async def _gather_forecasts():
+            limits = httpx.Limits(max_connections=10)
+            async with httpx.AsyncClient(http2=True, limits=limits) as client:
+                return await asyncio.gather(*[
+                    _fetch_forecast_async(client, location, start_date, end_date, api_key)
+                    for location in locations
+                ])
+
+        weather_data = {
+            location: result["data"]
+            for location, result in zip(locations, asyncio.run(_gather_forecasts()))
+            if result["status"] == "success"
+        }
     
     # If we got weather data, let LLM analyze and pick the best destination
     if weather_data:
@@ -146,27 +286,17 @@ def get_travel_destination(start_date: str, end_date: str, budget: float, api_ke
                 weather_summary += f"- {day['date']}: {day['conditions']}, {day['temp_min']}°C to {day['temp_max']}°C, {day['rain_chance']}% chance of rain\n"
             weather_summary += "\n"
         
-        prompt = f"""Based on the weather forecasts for different destinations:
-
-{weather_summary}
+        prompt = _WEATHER_ANALYSIS_PROMPT.format(weather_summary=weather_summary, start_date=start_date, end_date=end_date)
 
-Travel Dates: {start_date} to {end_date}
-
-Analyze the weather conditions and recommend the best destination to visit during these dates.
-Consider factors like temperature, rain probability, and overall conditions.
-Return the suggestions in order of preference (best first).
-
-Return the response in this exact JSON format:
-[
-    {{"destination": "City Name", "country": "Country Name"}}
-]
-
-Order the destinations from best to worst weather conditions.
-Only return the JSON array, no other text."""
-        
-        response = llm.inference(prompt)
-        # Parse and return the reordered suggestions
-        return json.loads(response[response.find("["):response.find("]")+1])[0]
+        # JSON mode guarantees a parseable object; the bracket scan stays as a
+        # fallback for models that ignore the response format
+        response = _get_llm().inference(prompt, response_format={"type": "json_object"})
+        try:
+            ranked = orjson.loads(response)["ranked"]
+        except (orjson.JSONDecodeError, KeyError, TypeError):
+            ranked = orjson.loads(_extract_json_array(response))
+        # Return the best destination
+        return ranked[0]
     
     # If we couldn't get weather data, return original suggestions
     return suggested_places
\ No newline at end of file